@@ -0,0 +1,910 @@
+"""Asynchronous Python SDK client for Memphora."""
+import asyncio
+import mimetypes
+import random
+import time
+import uuid
+from email.utils import parsedate_to_datetime
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+import json_codec
+from memory_client import MemphoraHTTPError
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class _Retry:
+    """Returned by the transport senders when a response should be retried."""
+
+    __slots__ = ("after",)
+
+    def __init__(self, after: Optional[float]):
+        # Seconds the server asked us to wait (Retry-After), if it did
+        self.after = after
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _ErrorResponse:
+    """Snapshot of a failed aiohttp response, shaped like the responses MemphoraHTTPError wraps."""
+
+    __slots__ = ("status_code", "url", "headers", "content")
+
+    def __init__(self, status_code: int, url: str, headers, content: bytes):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+
+
+def install_uvloop() -> None:
+    """
+    Make uvloop the asyncio event loop implementation.
+
+    Call once at startup, before creating event loops or clients. uvloop runs
+    the selector and task scheduling in C, which helps when thousands of
+    requests are in flight. Requires: pip install memphora[uvloop]
+    """
+    try:
+        import uvloop
+    except ImportError:
+        raise ImportError("install_uvloop requires uvloop. Install with: pip install memphora[uvloop]")
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+class AsyncMemoryClient:
+    """
+    Async client for interacting with the Memphora API.
+
+    Mirrors the surface of ``MemoryClient`` with ``async def`` methods so that
+    independent calls can be overlapped with ``asyncio.gather``. A single
+    ``aiohttp.ClientSession`` (or HTTP/2 ``httpx.AsyncClient``) is created
+    lazily and reused across all calls.
+
+    Usage:
+        async with AsyncMemoryClient(api_key="your_api_key") as client:
+            results = await client.batch_search([
+                {"user_id": "user123", "query": "favorite language"},
+                {"user_id": "user456", "query": "favorite language"},
+            ])
+
+    Requires the ``async`` extra: pip install memphora[async]
+    """
+
+    # Same statuses and methods the sync client retries on
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS"})
+    # Longest Retry-After honoured before retrying anyway
+    RETRY_AFTER_MAX = 60.0
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000/api/v1",
+        api_key: Optional[str] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 30,
+        transport: str = "aiohttp"
+    ):
+        """
+        Initialize the async memory client.
+
+        Args:
+            base_url: Base URL of the API server
+            api_key: Optional API key for authentication (Bearer token)
+            max_retries: Number of retries for retryable failures
+            backoff_factor: Base delay (seconds) for exponential backoff between retries
+            connection_limit: Maximum number of simultaneous connections
+            connection_limit_per_host: Maximum simultaneous connections to the API host
+            transport: "aiohttp" (default) or "httpx". The httpx transport speaks
+                HTTP/2 so concurrent calls share one multiplexed TLS connection.
+        """
+        if transport not in ("aiohttp", "httpx"):
+            raise ValueError(f"Unsupported transport {transport!r}; expected 'aiohttp' or 'httpx'")
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.transport = transport
+        self._session = None
+
+    @property
+    def session(self):
+        """Shared ``aiohttp.ClientSession`` (or ``httpx.AsyncClient``), created on first use."""
+        if self._session is None or self._is_closed(self._session):
+            headers = {}
+            if self.api_key:
+                headers["Authorization"] = f"Bearer {self.api_key}"
+            if self.transport == "httpx":
+                self._session = self._create_httpx_session(headers)
+            else:
+                self._session = self._create_aiohttp_session(headers)
+        return self._session
+
+    def _create_aiohttp_session(self, headers: Dict):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "AsyncMemoryClient requires aiohttp. Install with: pip install memphora[async]"
+            )
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        return aiohttp.ClientSession(connector=connector, headers=headers)
+
+    def _create_httpx_session(self, headers: Dict):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "transport='httpx' requires httpx with HTTP/2 support. "
+                "Install with: pip install memphora[http2]"
+            )
+        return httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=self.connection_limit,
+                max_keepalive_connections=self.connection_limit_per_host
+            ),
+            timeout=None
+        )
+
+    @staticmethod
+    def _is_closed(session) -> bool:
+        return session.is_closed if hasattr(session, "is_closed") else session.closed
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._is_closed(self._session):
+            if self.transport == "httpx":
+                await self._session.aclose()
+            else:
+                await self._session.close()
+        self._session = None
+
+    aclose = close
+
+    async def __aenter__(self) -> "AsyncMemoryClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, self.backoff_factor * (2 ** attempt))
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: Optional[Dict] = None,
+        files: Optional[Dict] = None,
+        parse_json: bool = True
+    ) -> Any:
+        """Send a request, retrying transient failures, and return the decoded body."""
+        if self.transport == "httpx":
+            import httpx
+            send = self._send_httpx
+            connection_errors = (httpx.TransportError,)
+        else:
+            import aiohttp
+            send = self._send_aiohttp
+            connection_errors = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+        url = f"{self.base_url}{path}"
+        body = json_codec.dumps(json) if json is not None else None
+        headers = _JSON_HEADERS if body is not None else None
+        if method == "POST":
+            # Lets the server de-duplicate POSTs replayed by the retry loop,
+            # including body-less ones such as test_webhook
+            headers = {**(headers or {}), "Idempotency-Key": uuid.uuid4().hex}
+        # Multipart uploads may stream from file objects that can't be replayed
+        retryable = method in self.RETRY_METHODS and not files
+        attempt = 0
+        while True:
+            try:
+                result = await send(
+                    method, url, body, headers, params, files, parse_json,
+                    retry_status=retryable and attempt < self.max_retries
+                )
+                if not isinstance(result, _Retry):
+                    return result
+                retry_after = result.after
+            except connection_errors:
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                retry_after = None
+            delay = self._backoff(attempt)
+            if retry_after is not None:
+                # Honour the server's throttling hint, like the sync client's urllib3 Retry
+                delay = min(max(retry_after, delay), self.RETRY_AFTER_MAX)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_aiohttp(self, method, url, body, headers, params, files, parse_json, retry_status):
+        data = body
+        if files:
+            import aiohttp
+            data = aiohttp.FormData()
+            for field, (filename, content, content_type) in files.items():
+                data.add_field(field, content, filename=filename, content_type=content_type)
+        async with self.session.request(
+            method, url, data=data, params=params, headers=headers
+        ) as response:
+            if retry_status and response.status in self.RETRY_STATUSES:
+                return _Retry(_retry_after(response.headers.get("Retry-After")))
+            if response.status >= 400:
+                # The body is read now because the response is released on exit
+                raise MemphoraHTTPError.from_response(_ErrorResponse(
+                    response.status, str(response.url), response.headers, await response.read()
+                ))
+            if not parse_json:
+                return None
+            return json_codec.loads(await response.read())
+
+    async def _send_httpx(self, method, url, body, headers, params, files, parse_json, retry_status):
+        response = await self.session.request(
+            method, url, content=body, params=params, files=files, headers=headers
+        )
+        if retry_status and response.status_code in self.RETRY_STATUSES:
+            return _Retry(_retry_after(response.headers.get("Retry-After")))
+        if response.status_code >= 400:
+            raise MemphoraHTTPError.from_response(response)
+        if not parse_json:
+            return None
+        return json_codec.loads(response.content)
+
+    # Fan-out helpers
+    async def batch_search(self, queries: List[Dict]) -> List[List[Dict]]:
+        """
+        Run several searches concurrently.
+
+        Args:
+            queries: List of keyword-argument dicts for ``search_memories``
+
+        Returns:
+            List of search results, in the same order as ``queries``
+        """
+        return await asyncio.gather(*[self.search_memories(**q) for q in queries])
+
+    async def batch_get_memories(self, memory_ids: List[str]) -> List[Dict]:
+        """Fetch several memories concurrently, preserving order."""
+        return await asyncio.gather(*[self.get_memory(m) for m in memory_ids])
+
+    async def bulk_export_gdpr(self, user_ids: List[str]) -> List[Dict]:
+        """Export GDPR data for several users concurrently, preserving order."""
+        return await asyncio.gather(*[self.export_gdpr(u) for u in user_ids])
+
+    async def bulk_get_audit_logs(self, user_ids: List[str], limit: int = 100) -> List[List[Dict]]:
+        """Fetch audit logs for several users concurrently, preserving order."""
+        return await asyncio.gather(*[self.get_audit_logs(user_id=u, limit=limit) for u in user_ids])
+
+    # Core Memory Operations
+    async def add_memory(
+        self,
+        user_id: str,
+        content: str,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """Add a new memory."""
+        payload = {
+            "user_id": user_id,
+            "content": content
+        }
+        if metadata:
+            payload["metadata"] = metadata
+
+        return await self._request("POST", "/memories", json=payload)
+
+    async def get_memory(self, memory_id: str) -> Dict:
+        """Get a memory by ID."""
+        return await self._request("GET", f"/memories/{memory_id}")
+
+    async def get_user_memories(self, user_id: str, limit: int = 100) -> List[Dict]:
+        """Get all memories for a user."""
+        return await self._request(
+            "GET", f"/memories/user/{user_id}", params={"limit": limit}
+        )
+
+    async def search_memories(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        rerank: bool = False,
+        rerank_provider: str = "auto",
+        cohere_api_key: Optional[str] = None,
+        jina_api_key: Optional[str] = None
+    ) -> List[Dict]:
+        """Search memories semantically with optional external reranking."""
+        payload = {
+            "user_id": user_id,
+            "query": query,
+            "limit": limit,
+            "rerank": rerank,
+            "rerank_provider": rerank_provider
+        }
+
+        if cohere_api_key:
+            payload["cohere_api_key"] = cohere_api_key
+        if jina_api_key:
+            payload["jina_api_key"] = jina_api_key
+
+        return await self._request("POST", "/memories/search", json=payload)
+
+    async def update_memory(
+        self,
+        memory_id: str,
+        content: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """Update a memory."""
+        update_data = {}
+        if content is not None:
+            update_data["content"] = content
+        if metadata is not None:
+            update_data["metadata"] = metadata
+
+        return await self._request("PUT", f"/memories/{memory_id}", json=update_data)
+
+    async def delete_memory(self, memory_id: str) -> bool:
+        """Delete a memory."""
+        await self._request("DELETE", f"/memories/{memory_id}", parse_json=False)
+        return True
+
+    async def extract_from_conversation(
+        self,
+        user_id: str,
+        conversation: List[Dict[str, str]]
+    ) -> List[Dict]:
+        """Extract and store memories from a conversation."""
+        return await self._request("POST", "/conversations/extract", json={
+            "user_id": user_id,
+            "conversation": conversation
+        })
+
+    async def extract_from_content(
+        self,
+        user_id: str,
+        content: str,
+        metadata: Optional[Dict] = None
+    ) -> List[Dict]:
+        """Extract and store memories from a single content string."""
+        payload = {
+            "user_id": user_id,
+            "content": content
+        }
+        if metadata:
+            payload["metadata"] = metadata
+
+        return await self._request("POST", "/memories/extract", json=payload)
+
+    # Advanced Memory Operations
+    async def create_advanced_memory(
+        self,
+        user_id: str,
+        content: str,
+        metadata: Optional[Dict] = None,
+        link_to: Optional[List[str]] = None
+    ) -> Dict:
+        """Create a memory with graph linking."""
+        payload = {
+            "user_id": user_id,
+            "content": content
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        if link_to:
+            payload["link_to"] = link_to
+
+        return await self._request("POST", "/memories/advanced", json=payload)
+
+    async def search_advanced(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict] = None,
+        include_related: bool = False,
+        min_score: float = 0.0,
+        sort_by: str = "relevance"
+    ) -> List[Dict]:
+        """Advanced memory search with filtering and scoring."""
+        payload = {
+            "user_id": user_id,
+            "query": query,
+            "limit": limit,
+            "include_related": include_related,
+            "min_score": min_score,
+            "sort_by": sort_by
+        }
+        if filters:
+            payload["filters"] = filters
+
+        return await self._request("POST", "/memories/search/advanced", json=payload)
+
+    async def batch_create(
+        self,
+        user_id: str,
+        memories: List[Dict[str, str]],
+        link_related: bool = True
+    ) -> List[Dict]:
+        """Create multiple memories in batch."""
+        return await self._request("POST", "/memories/batch", json={
+            "user_id": user_id,
+            "memories": memories,
+            "link_related": link_related
+        })
+
+    async def merge_memories(
+        self,
+        memory_ids: List[str],
+        merge_strategy: str = "combine"
+    ) -> Dict:
+        """Merge multiple memories."""
+        return await self._request("POST", "/memories/merge", json={
+            "memory_ids": memory_ids,
+            "merge_strategy": merge_strategy
+        })
+
+    async def find_contradictions(
+        self,
+        memory_id: str,
+        similarity_threshold: float = 0.7
+    ) -> List[Dict]:
+        """Find potentially contradictory memories."""
+        return await self._request(
+            "GET", f"/memories/{memory_id}/contradictions",
+            params={"similarity_threshold": similarity_threshold}
+        )
+
+    async def link_memories(
+        self,
+        memory_id: str,
+        target_id: str,
+        relationship_type: str = "related"
+    ) -> Dict:
+        """Link two memories in the graph."""
+        return await self._request(
+            "POST", f"/memories/{memory_id}/link",
+            params={
+                "target_id": target_id,
+                "relationship_type": relationship_type
+            }
+        )
+
+    async def get_memory_context(
+        self,
+        memory_id: str,
+        depth: int = 2
+    ) -> Dict:
+        """Get full context around a memory."""
+        return await self._request(
+            "GET", f"/memories/{memory_id}/context", params={"depth": depth}
+        )
+
+    async def find_memory_path(
+        self,
+        source_id: str,
+        target_id: str
+    ) -> Dict:
+        """Find shortest path between two memories in the graph."""
+        return await self._request("GET", f"/memories/{source_id}/path/{target_id}")
+
+    # Export/Import
+    async def export_memories(
+        self,
+        user_id: str,
+        format: str = "json"
+    ) -> Dict:
+        """Export all memories for a user."""
+        return await self._request(
+            "GET", f"/users/{user_id}/export", params={"format": format}
+        )
+
+    async def import_memories(
+        self,
+        user_id: str,
+        data: str,
+        format: str = "json"
+    ) -> Dict:
+        """Import memories for a user."""
+        return await self._request(
+            "POST", f"/users/{user_id}/import",
+            params={"format": format},
+            json={"data": data}
+        )
+
+    # Statistics
+    async def get_user_statistics(self, user_id: str) -> Dict:
+        """Get statistics about user memories."""
+        return await self._request("GET", f"/users/{user_id}/statistics")
+
+    async def get_global_statistics(self) -> Dict:
+        """Get global statistics."""
+        return await self._request("GET", "/statistics")
+
+    async def delete_all_user_memories(self, user_id: str) -> Dict:
+        """Delete all memories for a user."""
+        return await self._request("DELETE", f"/users/{user_id}/memories")
+
+    async def set_retention_policy(
+        self,
+        data_type: str,
+        retention_days: int,
+        organization_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        auto_delete: bool = False
+    ) -> Dict:
+        """Set a data retention policy (organization-level or user-level)."""
+        return await self._request("POST", "/security/retention-policies", json={
+            "data_type": data_type,
+            "retention_days": retention_days,
+            "organization_id": organization_id,
+            "user_id": user_id,
+            "auto_delete": auto_delete
+        })
+
+    async def apply_retention_policies(
+        self,
+        organization_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> Dict:
+        """Apply retention policies and delete old data."""
+        params = {}
+        if organization_id:
+            params["organization_id"] = organization_id
+        if user_id:
+            params["user_id"] = user_id
+
+        return await self._request("POST", "/security/apply-retention", params=params)
+
+    # Memory Versioning
+    async def get_memory_versions(self, memory_id: str, limit: int = 50) -> List[Dict]:
+        """Get all versions for a memory."""
+        return await self._request(
+            "GET", f"/memories/{memory_id}/versions", params={"limit": limit}
+        )
+
+    async def get_version(self, version_id: str) -> Dict:
+        """Get a specific version."""
+        return await self._request("GET", f"/versions/{version_id}")
+
+    async def get_version_history(
+        self,
+        memory_id: str,
+        from_version: Optional[int] = None,
+        to_version: Optional[int] = None
+    ) -> List[Dict]:
+        """Get version history for a memory."""
+        params = {}
+        if from_version is not None:
+            params["from_version"] = from_version
+        if to_version is not None:
+            params["to_version"] = to_version
+
+        return await self._request("GET", f"/memories/{memory_id}/history", params=params)
+
+    async def rollback_memory(
+        self,
+        memory_id: str,
+        target_version: int,
+        user_id: str
+    ) -> Dict:
+        """Rollback a memory to a specific version."""
+        return await self._request(
+            "POST", f"/memories/{memory_id}/rollback",
+            params={"user_id": user_id},
+            json={"target_version": target_version}
+        )
+
+    async def compare_versions(
+        self,
+        version_id_1: str,
+        version_id_2: str
+    ) -> Dict:
+        """Compare two versions of a memory."""
+        return await self._request(
+            "GET", "/versions/compare",
+            params={
+                "version_id_1": version_id_1,
+                "version_id_2": version_id_2
+            }
+        )
+
+    # Conversation Features
+    async def record_conversation(
+        self,
+        user_id: str,
+        conversation: List[Dict[str, str]],
+        platform: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """Record a full conversation."""
+        payload = {
+            "user_id": user_id,
+            "conversation": conversation,
+            "platform": platform or "unknown"
+        }
+        if metadata:
+            payload["metadata"] = metadata
+
+        return await self._request("POST", "/conversations/record", json=payload)
+
+    async def get_conversation(self, conversation_id: str) -> Dict:
+        """Get a conversation by ID."""
+        return await self._request("GET", f"/conversations/{conversation_id}")
+
+    async def get_user_conversations(
+        self,
+        user_id: str,
+        platform: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict]:
+        """Get all conversations for a user."""
+        params = {"limit": limit}
+        if platform:
+            params["platform"] = platform
+
+        return await self._request("GET", f"/conversations/user/{user_id}", params=params)
+
+    async def summarize_conversation(
+        self,
+        conversation: List[Dict[str, str]],
+        summary_type: str = "brief"
+    ) -> Dict:
+        """Summarize a conversation."""
+        return await self._request("POST", "/conversations/summarize", json={
+            "conversation": conversation,
+            "summary_type": summary_type
+        })
+
+    # Performance Features
+    async def search_optimized(
+        self,
+        user_id: str,
+        query: str,
+        max_tokens: int = 2000,
+        max_memories: int = 20,
+        use_compression: bool = True,
+        use_cache: bool = True
+    ) -> Dict:
+        """Optimized memory search."""
+        return await self._request("POST", "/memories/search/optimized", json={
+            "user_id": user_id,
+            "query": query,
+            "max_tokens": max_tokens,
+            "max_memories": max_memories,
+            "use_compression": use_compression,
+            "use_cache": use_cache
+        })
+
+    async def search_enhanced(
+        self,
+        user_id: str,
+        query: str,
+        max_tokens: int = 2000,
+        max_memories: int = 20,
+        use_compression: bool = True
+    ) -> Dict:
+        """Enhanced search with maximum performance."""
+        return await self._request("POST", "/memories/search/enhanced", json={
+            "user_id": user_id,
+            "query": query,
+            "max_tokens": max_tokens,
+            "max_memories": max_memories,
+            "use_compression": use_compression
+        })
+
+    # Text Features
+    async def concise_text(self, text: str) -> Dict:
+        """Make text more concise."""
+        return await self._request("POST", "/text/conciser", json={"text": text})
+
+    # Multimodal Features
+    async def store_image(
+        self,
+        user_id: str,
+        image_url: Optional[str] = None,
+        image_base64: Optional[str] = None,
+        description: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """Store an image memory."""
+        payload = {
+            "user_id": user_id,
+            "image_url": image_url,
+            "image_base64": image_base64,
+            "description": description
+        }
+        if metadata:
+            payload["metadata"] = metadata
+
+        return await self._request("POST", "/memories/image", json=payload)
+
+    async def upload_image(
+        self,
+        user_id: str,
+        image_data: Union[bytes, BinaryIO],
+        filename: str,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """Upload and process an image; file objects are streamed rather than read into memory."""
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        # user_id is sent as query parameter, not form data
+        return await self._request(
+            "POST", "/memories/image/upload",
+            params={"user_id": user_id},
+            files={"file": (filename, image_data, content_type)}
+        )
+
+    async def search_images(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5
+    ) -> List[Dict]:
+        """Search memories using image descriptions."""
+        return await self._request(
+            "POST", "/memories/image/search",
+            json={"user_id": user_id, "query": query, "limit": limit}
+        )
+
+    # Security & Compliance
+    async def export_gdpr(self, user_id: str) -> Dict:
+        """Export all user data for GDPR compliance."""
+        return await self._request("GET", f"/security/compliance/gdpr/export/{user_id}")
+
+    async def delete_gdpr(self, user_id: str) -> Dict:
+        """Delete all user data for GDPR compliance."""
+        return await self._request("DELETE", f"/security/compliance/gdpr/delete/{user_id}")
+
+    async def record_compliance_event(
+        self,
+        compliance_type: str,
+        event_type: str,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        data_subject_id: Optional[str] = None,
+        details: Optional[Dict] = None
+    ) -> Dict:
+        """Record a compliance event."""
+        payload = {
+            "compliance_type": compliance_type,
+            "event_type": event_type,
+            "user_id": user_id,
+            "organization_id": organization_id,
+            "data_subject_id": data_subject_id
+        }
+        if details:
+            payload["details"] = details
+
+        return await self._request("POST", "/security/compliance-events", json=payload)
+
+    async def encrypt_data(self, data: str) -> Dict:
+        """Encrypt sensitive data."""
+        return await self._request("POST", "/security/encrypt", json={"data": data})
+
+    async def decrypt_data(self, encrypted_data: str) -> Dict:
+        """Decrypt data."""
+        return await self._request(
+            "POST", "/security/decrypt", json={"encrypted_data": encrypted_data}
+        )
+
+    async def get_compliance_report(
+        self,
+        organization_id: str,
+        compliance_type: Optional[str] = None
+    ) -> Dict:
+        """Get compliance report for an organization."""
+        params = {}
+        if compliance_type:
+            params["compliance_type"] = compliance_type
+
+        return await self._request(
+            "GET", f"/security/compliance/report/{organization_id}", params=params
+        )
+
+    # Health Check
+    async def health_check(self) -> Dict:
+        """Check API health status."""
+        return await self._request("GET", "/health")
+
+    # Webhooks
+    async def create_webhook(
+        self,
+        url: str,
+        events: List[str],
+        secret: Optional[str] = None
+    ) -> Dict:
+        """Create a new webhook."""
+        return await self._request("POST", "/webhooks", json={
+            "url": url,
+            "events": events,
+            "secret": secret
+        })
+
+    async def list_webhooks(self, user_id: Optional[str] = None) -> List[Dict]:
+        """List all webhooks."""
+        params = {}
+        if user_id:
+            params["user_id"] = user_id
+
+        return await self._request("GET", "/webhooks", params=params)
+
+    async def get_webhook(self, webhook_id: str) -> Dict:
+        """Get a webhook by ID."""
+        return await self._request("GET", f"/webhooks/{webhook_id}")
+
+    async def update_webhook(
+        self,
+        webhook_id: str,
+        url: Optional[str] = None,
+        events: Optional[List[str]] = None,
+        secret: Optional[str] = None,
+        active: Optional[bool] = None
+    ) -> Dict:
+        """Update a webhook."""
+        update_data = {
+            key: value
+            for key, value in (("url", url), ("events", events), ("secret", secret), ("active", active))
+            if value is not None
+        }
+
+        return await self._request("PUT", f"/webhooks/{webhook_id}", json=update_data)
+
+    async def delete_webhook(self, webhook_id: str) -> Dict:
+        """Delete a webhook."""
+        return await self._request("DELETE", f"/webhooks/{webhook_id}")
+
+    async def test_webhook(self, webhook_id: str) -> Dict:
+        """Test a webhook with a sample event."""
+        return await self._request("POST", f"/webhooks/{webhook_id}/test")
+
+    # Observability
+    async def get_metrics(self) -> Dict:
+        """Get system metrics."""
+        return await self._request("GET", "/metrics")
+
+    async def get_metrics_summary(self) -> Dict:
+        """Get metrics summary."""
+        return await self._request("GET", "/metrics/summary")
+
+    async def get_audit_logs(
+        self,
+        user_id: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """Get audit logs."""
+        params = {"limit": limit}
+        if user_id:
+            params["user_id"] = user_id
+
+        result = await self._request("GET", "/audit-logs", params=params)
+        # Backend returns {"logs": [...]}, extract the list
+        if isinstance(result, dict) and "logs" in result:
+            return result["logs"]
+        return result if isinstance(result, list) else []
@@ -0,0 +1,235 @@
+"""Coalesce individual Memphora writes into batch requests."""
+import logging
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """True for failures worth resending: 429/5xx responses and connection-level errors."""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    # Without a status the request never got an answer (connection error, timeout,
+    # open circuit); TypeError/ValueError mean the payload itself can't be sent
+    return not isinstance(error, (TypeError, ValueError))
+
+
+class BufferedWriter:
+    """
+    Buffer ``add_memory``-style writes and send them through ``batch_create``.
+
+    Memories are grouped per user and flushed when a user's buffer reaches
+    ``max_batch`` items, when ``max_wait_ms`` has passed since the first
+    buffered write, or when the writer is closed. Errors raised by a
+    background flush are re-raised on the next ``add``/``flush``/``close``.
+    A batch that fails transiently (connection error, 429, 5xx) stays buffered
+    and is retried, up to ``MAX_ATTEMPTS`` sends; a batch that fails
+    permanently (e.g. a 4xx validation error) is dropped and logged.
+
+    Usage:
+        with client.buffered(max_batch=100, max_wait_ms=50) as writer:
+            for text in texts:
+                writer.add(user_id, text)
+        created = writer.results
+    """
+
+    # Sends of one group before a transiently failing batch is dropped
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        client,
+        max_batch: int = 100,
+        max_wait_ms: float = 50,
+        link_related: bool = True
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            client: ``MemoryClient`` used to send batches
+            max_batch: Number of buffered items per group that triggers a flush
+            max_wait_ms: Maximum time an item waits in the buffer before being sent
+            link_related: Passed through to ``batch_create``
+        """
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.link_related = link_related
+        self.results: List[Any] = []
+        self._lock = threading.Lock()
+        # Serializes sends so batches reach the server in buffering order
+        self._send_lock = threading.Lock()
+        self._pending: Dict[Hashable, List[Dict]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._error: Optional[BaseException] = None
+        # group -> failed sends of its current batch; only touched under _send_lock
+        self._attempts: Dict[Hashable, int] = {}
+
+    def add(self, user_id: str, content: str, metadata: Optional[Dict] = None) -> None:
+        """Buffer a memory for ``user_id``; sends a batch once ``max_batch`` is reached."""
+        memory = {"content": content}
+        if metadata:
+            memory["metadata"] = metadata
+        self._buffer(user_id, memory)
+
+    def flush(self) -> None:
+        """Send everything currently buffered."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._cancel_timer()
+        self._send(pending)
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Flush remaining items and stop the background timer."""
+        self.flush()
+
+    def _send_batch(self, key: Hashable, items: List[Dict]) -> Any:
+        """Send one group of buffered items and return the server's response."""
+        return self.client.batch_create(key, items, link_related=self.link_related)
+
+    def _buffer(self, key: Hashable, item: Dict) -> None:
+        # The item is buffered before an earlier background error is raised, so it isn't lost
+        with self._lock:
+            batch = self._pending.setdefault(key, [])
+            batch.append(item)
+            full = len(batch) >= self.max_batch
+            if full:
+                del self._pending[key]
+            else:
+                self._arm_timer()
+        if full:
+            self._send({key: batch})
+        self._raise_pending_error()
+
+    def _arm_timer(self) -> None:
+        """Start the max-wait timer unless one is running; call with ``_lock`` held."""
+        if self._timer is None:
+            self._timer = threading.Timer(self.max_wait, self._flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            pending, self._pending = self._pending, {}
+        try:
+            self._send(pending)
+        except Exception as e:
+            self._error = e
+            with self._lock:
+                # Requeued batches would otherwise wait for the next add or flush
+                if self._pending:
+                    self._arm_timer()
+
+    def _send(self, pending: Dict[Hashable, List[Dict]]) -> None:
+        """Send every group; transient failures are buffered again and the first error is raised."""
+        error: Optional[BaseException] = None
+        with self._send_lock:
+            for key, items in pending.items():
+                try:
+                    result = self._send_batch(key, items)
+                except Exception as e:
+                    attempts = self._attempts.get(key, 0) + 1
+                    if _is_transient(e) and attempts < self.MAX_ATTEMPTS:
+                        self._attempts[key] = attempts
+                        self._requeue(key, items)
+                    else:
+                        self._attempts.pop(key, None)
+                        logger.error("Dropping %d buffered item(s) for %r: %s", len(items), key, e)
+                    if error is None:
+                        error = e
+                    continue
+                self._attempts.pop(key, None)
+                self._collect(result)
+        if error is not None:
+            raise error
+
+    def _collect(self, result: Any) -> None:
+        """Keep a batch response in ``results``."""
+        if isinstance(result, list):
+            self.results.extend(result)
+        else:
+            self.results.append(result)
+
+    def _requeue(self, key: Hashable, items: List[Dict]) -> None:
+        with self._lock:
+            # Ahead of anything buffered since, so order is kept on the next flush
+            self._pending[key] = items + self._pending.get(key, [])
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _raise_pending_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Don't mask the exception already propagating out of the with block
+        try:
+            self.close()
+        except Exception:
+            logger.error("Failed to flush buffered writes", exc_info=True)
+
+
+class ComplianceEventBuffer(BufferedWriter):
+    """
+    Buffer compliance events and send them through ``record_compliance_events_batch``.
+
+    Usage:
+        with client.compliance_event_buffer() as events:
+            events.add("GDPR", "data_access", user_id=user_id)
+    """
+
+    def __init__(self, client, max_batch: int = 256, flush_interval: float = 0.5):
+        """
+        Initialize the buffer.
+
+        Args:
+            client: ``MemoryClient`` used to send batches
+            max_batch: Number of buffered events that triggers a flush
+            flush_interval: Maximum seconds an event waits before being sent
+        """
+        super().__init__(client, max_batch=max_batch, max_wait_ms=flush_interval * 1000)
+
+    def add(
+        self,
+        compliance_type: str,
+        event_type: str,
+        user_id: Optional[str] = None,
+        organization_id: Optional[str] = None,
+        data_subject_id: Optional[str] = None,
+        details: Optional[Dict] = None
+    ) -> None:
+        """Buffer a compliance event; arguments match ``record_compliance_event``."""
+        event = {
+            "compliance_type": compliance_type,
+            "event_type": event_type,
+            "user_id": user_id,
+            "organization_id": organization_id,
+            "data_subject_id": data_subject_id
+        }
+        if details:
+            event["details"] = details
+        self._buffer(None, event)
+
+    def _send_batch(self, key: Hashable, items: List[Dict]) -> Any:
+        return self.client.record_compliance_events_batch(items)
+
+    def _collect(self, result: Any) -> None:
+        # Lives as long as its client and nobody reads the acknowledgements,
+        # so keeping them would grow without bound
+        pass
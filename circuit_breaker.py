@@ -0,0 +1,76 @@
+"""Per-endpoint circuit breaker for Memphora API calls."""
+import threading
+import time
+from typing import Dict, List
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while its endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(f"Circuit open for {endpoint}; retry in {retry_in:.1f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Stop calling endpoints that keep failing.
+
+    After ``failure_threshold`` consecutive failures (5xx responses or
+    connection errors) an endpoint's circuit opens and calls fail fast with
+    ``CircuitOpenError`` for ``cooldown`` seconds. The first call after the
+    cooldown is let through as a probe: success closes the circuit, failure
+    opens it again. Endpoints are keyed by method and path template: callers
+    pass the template (``/webhooks/{webhook_id}``) rather than the concrete
+    path, so ``/webhooks/abc`` and ``/webhooks/def`` share one circuit.
+
+    Usage:
+        breaker = CircuitBreaker(failure_threshold=5, cooldown=30)
+        key = breaker.before("GET", "/webhooks/{webhook_id}")
+        ...
+        breaker.record(key, success=True)
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            cooldown: Seconds a circuit stays open before a probe is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        # endpoint -> [consecutive_failures, opened_at or None]
+        self._circuits: Dict[str, List] = {}
+
+    @staticmethod
+    def endpoint(method: str, template: str) -> str:
+        """Return the circuit key for a request, e.g. ``GET /webhooks/{webhook_id}``."""
+        return f"{method} {template.split('?', 1)[0]}"
+
+    def before(self, method: str, template: str) -> str:
+        """Raise CircuitOpenError if the endpoint is open; return its circuit key."""
+        key = self.endpoint(method, template)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit[1] is not None:
+                remaining = circuit[1] + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(key, remaining)
+                # Half-open: let this call probe, keep others failing fast meanwhile
+                circuit[1] = time.monotonic()
+        return key
+
+    def record(self, key: str, success: bool) -> None:
+        """Record the outcome of a call made after ``before``."""
+        with self._lock:
+            if success:
+                self._circuits.pop(key, None)
+                return
+            circuit = self._circuits.setdefault(key, [0, None])
+            circuit[0] += 1
+            if circuit[0] >= self.failure_threshold:
+                circuit[1] = time.monotonic()
@@ -383,9 +383,10 @@ class MemphoraCrewAI:
     
     def store_shared(self, content: str, metadata: Optional[Dict] = None) -> Dict:
         """Store a shared memory accessible by all agents."""
-        meta = metadata or {}
-        meta["shared"] = True
-        meta["crew_id"] = self.crew_id
+        meta = {"shared": True, "crew_id": self.crew_id}
+        if metadata:
+            # Copy rather than tag the caller's dict in place
+            meta = {**metadata, **meta}
         return self.memphora.store_group_memory(self.crew_id, content, meta)
     
     def search_shared(self, query: str, limit: int = 10) -> Dict:
@@ -0,0 +1,28 @@
+"""JSON encoding for Memphora SDK traffic, using orjson when it is installed."""
+import json
+from typing import Any
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes with the standard library."""
+    # Compact and unescaped, matching orjson's output
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+        try:
+            # Non-str keys (e.g. int keys in caller metadata) are stringified like json does
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Whatever else orjson rejects but json accepts, such as ints beyond 64 bits
+            return _stdlib_dumps(obj)
+
+    loads = orjson.loads
+except ImportError:
+    # Fall back to the standard library (pip install memphora[fast] for orjson)
+    dumps = _stdlib_dumps
+    loads = json.loads
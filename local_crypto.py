@@ -0,0 +1,85 @@
+"""Client-side envelope encryption for Memphora data."""
+import base64
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from response_cache import TTLCache
+
+NONCE_SIZE = 12
+
+
+class EnvelopeCipher:
+    """
+    AES-256-GCM encryption with data keys issued by the Memphora API.
+
+    A data encryption key (DEK) is fetched once through ``fetch_key`` and kept
+    for ``ttl`` seconds, so encrypting or decrypting a record is a local
+    operation (AES-NI/ARMv8 crypto via OpenSSL) instead of an HTTP round trip.
+    Ciphertexts carry the key ID so older records can still be decrypted after
+    the current key rotates.
+
+    Requires cryptography: pip install memphora[crypto]
+    """
+
+    def __init__(self, fetch_key: Callable[[Optional[str]], Dict], ttl: float = 3600):
+        """
+        Initialize the cipher.
+
+        Args:
+            fetch_key: Callable taking an optional key ID and returning
+                ``{"key_id": str, "key": base64 32-byte key}``; with no ID it
+                should return the current key
+            ttl: Seconds a fetched key is kept in memory
+        """
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError:
+            raise ImportError(
+                "Local encryption requires cryptography. Install with: pip install memphora[crypto]"
+            )
+        self._aesgcm = AESGCM
+        self._fetch_key = fetch_key
+        self._keys = TTLCache(maxsize=64, ttl=ttl)
+        self._current: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def encrypt(self, data: str) -> Dict:
+        """Encrypt ``data``; returns ``{"encrypted_data": str, "key_id": str}``."""
+        key_id, aead = self._current_key()
+        nonce = os.urandom(NONCE_SIZE)
+        # The key ID is bound as associated data so it can't be swapped
+        sealed = aead.encrypt(nonce, data.encode("utf-8"), key_id.encode("utf-8"))
+        return {
+            "encrypted_data": base64.b64encode(nonce + sealed).decode("ascii"),
+            "key_id": key_id,
+        }
+
+    def decrypt(self, encrypted_data: str, key_id: str) -> Dict:
+        """Decrypt a value produced by ``encrypt``; returns ``{"decrypted_data": str}``."""
+        aead = self._key(key_id)
+        raw = base64.b64decode(encrypted_data)
+        plain = aead.decrypt(raw[:NONCE_SIZE], raw[NONCE_SIZE:], key_id.encode("utf-8"))
+        return {"decrypted_data": plain.decode("utf-8")}
+
+    def _current_key(self) -> Tuple[str, object]:
+        with self._lock:
+            key_id = self._current
+            aead = self._keys.get(key_id) if key_id is not None else None
+        if aead is None:
+            key_id, aead = self._load(None)
+            with self._lock:
+                self._current = key_id
+        return key_id, aead
+
+    def _key(self, key_id: str):
+        aead = self._keys.get(key_id)
+        if aead is None:
+            _, aead = self._load(key_id)
+        return aead
+
+    def _load(self, key_id: Optional[str]):
+        issued = self._fetch_key(key_id)
+        aead = self._aesgcm(base64.b64decode(issued["key"]))
+        self._keys.set(issued["key_id"], aead)
+        return issued["key_id"], aead
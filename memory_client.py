@@ -1,49 +1,496 @@
 """Python SDK client for Memphora."""
+import logging
+import mimetypes
+import time
 import requests
-from typing import List, Dict, Optional
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator, List, Dict, Optional, Union
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from semantic_cache import SemanticCache
+from response_cache import TTLCache
+from buffered_writer import BufferedWriter, ComplianceEventBuffer
+from rate_limiter import AIMDLimiter
+from local_crypto import EnvelopeCipher
+from circuit_breaker import CircuitBreaker
+import json_codec
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Sentinel distinguishing a cache miss from a cached falsy response
+_MISSING = object()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_MSGPACK_TYPE = "application/msgpack"
+_MSGPACK_HEADERS = {"Content-Type": _MSGPACK_TYPE}
+
+
+class MemphoraHTTPError(requests.HTTPError):
+    """Error response (4xx/5xx) from the Memphora API, raised by every transport."""
+
+    @classmethod
+    def from_response(cls, response) -> "MemphoraHTTPError":
+        status = response.status_code
+        kind = "Client" if status < 500 else "Server"
+        return cls(f"{status} {kind} Error for url: {response.url}", response=response)
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return self.response.status_code if self.response is not None else None
+
+
+class _NotFound:
+    """Response cache entry recording a 404, so the lookup can fail without a request."""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response):
+        self.response = response
+
+
+class _BaseURLSession(requests.Session):
+    """requests Session that resolves "/path" URLs against a fixed base URL, like httpx.Client."""
+
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url
+
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith("/"):
+            url = self.base_url + url
+        return super().request(method, url, *args, **kwargs)
 
 
 class MemoryClient:
     """Client for interacting with the Memphora API."""
     
-    def __init__(self, base_url: str = "http://localhost:8000/api/v1", api_key: Optional[str] = None):
+    # Request bodies larger than this are gzip-compressed when compress_requests is on
+    COMPRESS_MIN_BYTES = 1024
+    # Level 1 keeps most of the size reduction on JSON at a fraction of the CPU
+    COMPRESS_LEVEL = 1
+    # Methods retried on connection errors and retryable statuses
+    RETRY_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS"})
+    # Read size for streamed downloads (export_memories_to_file, *_iter)
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000/api/v1",
+        api_key: Optional[str] = None,
+        pool_connections: int = 32,
+        pool_maxsize: int = 32,
+        transport: str = "requests",
+        enable_semantic_cache: bool = False,
+        semantic_cache: Optional[SemanticCache] = None,
+        enable_response_cache: bool = False,
+        response_cache: Optional[TTLCache] = None,
+        compress_requests: bool = False,
+        warm: bool = False,
+        wire_format: str = "json",
+        conditional_get: bool = False,
+        enable_rate_limiter: bool = False,
+        rate_limiter: Optional[AIMDLimiter] = None,
+        local_encryption: bool = False,
+        enable_circuit_breaker: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
         """
         Initialize the memory client.
         
         Args:
             base_url: Base URL of the API server
             api_key: Optional API key for authentication (Bearer token)
+            pool_connections: Number of connection pools to cache (one per host)
+            pool_maxsize: Maximum connections kept alive per pool. Raise this when
+                sharing one client across many threads to avoid
+                "Connection pool is full" warnings and repeated handshakes.
+            transport: HTTP transport to use: "requests" (default), "httpx" or
+                "urllib3". The httpx transport speaks HTTP/2 and multiplexes
+                concurrent calls over a single TLS connection
+                (pip install memphora[http2]). The urllib3 transport calls
+                urllib3.PoolManager directly, skipping requests' per-call
+                overhead; image uploads are then buffered in memory.
+            enable_semantic_cache: Reuse search responses for near-duplicate queries
+                (cosine similarity >= 0.95) instead of calling the backend again
+                (pip install memphora[semantic-cache]).
+            semantic_cache: Optional pre-configured SemanticCache; implies
+                enable_semantic_cache.
+            enable_response_cache: Serve repeated reads (get_memory, statistics,
+                versions, exports, ...) from a 60 second in-process cache. Writes
+                made through this client invalidate the affected entries.
+            response_cache: Optional pre-configured TTLCache; implies
+                enable_response_cache.
+            compress_requests: Gzip large JSON request bodies (batch_create,
+                import_memories, conversations, base64 images). Only enable this
+                when the API server accepts Content-Encoding: gzip. Responses are
+                always requested compressed.
+            warm: Open a pooled keep-alive connection during construction so the
+                first real call doesn't pay the TCP/TLS handshake. Failures are
+                ignored.
+            wire_format: "json" (default) or "msgpack". With msgpack, request
+                bodies are sent as application/msgpack and msgpack responses are
+                requested via Accept; JSON responses are still decoded, so a
+                server without msgpack support keeps working for reads. Request
+                bodies do require server support (pip install memphora[msgpack]).
+            conditional_get: Remember ETags of read responses and revalidate with
+                If-None-Match, so unchanged resources come back as a body-less 304
+                and are served from the locally kept copy.
+            enable_rate_limiter: Cap concurrent requests with an adaptive (AIMD)
+                limit that shrinks on 429/5xx and honours Retry-After and
+                X-RateLimit-* headers. Useful when many threads share a client.
+            rate_limiter: Optional pre-configured AIMDLimiter; implies
+                enable_rate_limiter.
+            local_encryption: Encrypt/decrypt with AES-256-GCM on the client using
+                a data key fetched once from the API, instead of one request per
+                value (pip install memphora[crypto]).
+            enable_circuit_breaker: Fail fast with CircuitOpenError on endpoints
+                that returned 5 consecutive 5xx/connection errors, for a 30 second
+                cooldown, instead of waiting on each failing call.
+            circuit_breaker: Optional pre-configured CircuitBreaker; implies
+                enable_circuit_breaker.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        
-        # Set up session with retries
-        self.session = requests.Session()
-        retry_strategy = Retry(
+        self.transport = transport
+        self.pool_maxsize = pool_maxsize
+        if semantic_cache is None and enable_semantic_cache:
+            semantic_cache = SemanticCache()
+        self._semantic_cache = semantic_cache
+        if response_cache is None and enable_response_cache:
+            response_cache = TTLCache(maxsize=2048, ttl=60)
+        self._response_cache = response_cache
+        self._etag_cache = TTLCache(maxsize=1024, ttl=3600) if conditional_get else None
+        if rate_limiter is None and enable_rate_limiter:
+            rate_limiter = AIMDLimiter()
+        self._rate_limiter = rate_limiter
+        self._compliance_buffer: Optional[ComplianceEventBuffer] = None
+        self._cipher = EnvelopeCipher(self.get_data_key) if local_encryption else None
+        if circuit_breaker is None and enable_circuit_breaker:
+            circuit_breaker = CircuitBreaker()
+        self._circuit_breaker = circuit_breaker
+        self.compress_requests = compress_requests
+        if wire_format == "msgpack":
+            try:
+                import msgpack
+            except ImportError:
+                raise ImportError(
+                    "wire_format='msgpack' requires msgpack. Install with: pip install memphora[msgpack]"
+                )
+            self._msgpack = msgpack
+        elif wire_format == "json":
+            self._msgpack = None
+        else:
+            raise ValueError(f"Unsupported wire_format {wire_format!r}; expected 'json' or 'msgpack'")
+        self.wire_format = wire_format
+        
+        if transport == "requests":
+            self.session = self._create_requests_session(pool_connections, pool_maxsize)
+        elif transport == "httpx":
+            self.session = self._create_httpx_session(pool_maxsize)
+        elif transport == "urllib3":
+            from urllib3_session import Urllib3Session
+            self.session = Urllib3Session(
+                self.base_url,
+                num_pools=pool_connections,
+                maxsize=pool_maxsize,
+                retries=self._retry_strategy()
+            )
+        else:
+            raise ValueError(
+                f"Unsupported transport {transport!r}; expected 'requests', 'httpx' or 'urllib3'"
+            )
+        
+        # Default headers (API key if provided) are built once and carried by the session
+        self._base_headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.session.headers.update(self._base_headers)
+        if self._msgpack is not None:
+            self.session.headers["Accept"] = f"{_MSGPACK_TYPE}, application/json;q=0.9"
+        
+        if warm:
+            self._warm_up()
+    
+    def _warm_up(self) -> None:
+        """Establish a pooled connection to the API host; errors are non-fatal."""
+        try:
+            self.session.head(self.base_url, timeout=2)
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Send queued compliance events and close the HTTP session and its pooled connections."""
+        try:
+            self.flush_compliance_events()
+        finally:
+            self.session.close()
+    
+    def __enter__(self) -> "MemoryClient":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def _retry_strategy(self) -> Retry:
+        """Retry policy shared by the requests and urllib3 transports."""
+        # POST is retried too: most endpoints are POST, and _request tags each
+        # POST with an Idempotency-Key so the server can drop replays
+        return Retry(
             total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            backoff_factor=0.5,
+            backoff_jitter=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=self.RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    
+    def _create_requests_session(self, pool_connections: int, pool_maxsize: int) -> requests.Session:
+        """Create a requests session with retries and a sized connection pool."""
+        session = _BaseURLSession(self.base_url)
+        retry_strategy = self._retry_strategy()
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=False
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Streamed multipart uploads can't be replayed, so they keep urllib3's
+        # default idempotent-only policy (requests picks the longest mounted prefix)
+        upload_adapter = HTTPAdapter(
+            max_retries=retry_strategy.new(allowed_methods=Retry.DEFAULT_ALLOWED_METHODS),
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            pool_block=False
+        )
+        session.mount(f"{self.base_url}/memories/image/upload", upload_adapter)
+        session.mount(f"{self.base_url}/documents/upload", upload_adapter)
+        return session
+    
+    def _create_httpx_session(self, pool_maxsize: int):
+        """Create an HTTP/2 httpx client; exposes the same get/post/put/delete surface."""
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "transport='httpx' requires httpx with HTTP/2 support. "
+                "Install with: pip install memphora[http2]"
+            )
+        limits = httpx.Limits(max_keepalive_connections=pool_maxsize, max_connections=100)
+        return httpx.Client(
+            base_url=self.base_url,
+            # httpx only retries connection failures; status retries stay with requests
+            transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3),
+            timeout=None
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Set default headers with API key if provided
-        if self.api_key:
-            self.session.headers.update({
-                "Authorization": f"Bearer {self.api_key}"
-            })
     
     def _get_headers(self, additional_headers: Optional[Dict] = None) -> Dict:
         """Get request headers with API key."""
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        if additional_headers:
-            headers.update(additional_headers)
-        return headers
+        return {**self._base_headers, **(additional_headers or {})}
+    
+    def _send_json(
+        self,
+        method: str,
+        url: str,
+        payload: Any,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None
+    ):
+        """Send ``payload`` in the configured wire format, gzip-compressing large bodies when enabled."""
+        if self._msgpack is None:
+            body = json_codec.dumps(payload)
+            content_headers = _JSON_HEADERS
+        else:
+            body = self._msgpack.packb(payload, use_bin_type=True)
+            content_headers = _MSGPACK_HEADERS
+        headers = {**headers, **content_headers} if headers else content_headers
+        if self.compress_requests and len(body) > self.COMPRESS_MIN_BYTES:
+            import gzip
+            body = gzip.compress(body, compresslevel=self.COMPRESS_LEVEL)
+            headers = {**headers, "Content-Encoding": "gzip"}
+        # httpx takes raw bytes via content=, requests via data=
+        body_kwarg = "content" if self.transport == "httpx" else "data"
+        return self.session.request(method, url, params=params, headers=headers, **{body_kwarg: body})
+    
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        endpoint: Optional[str] = None
+    ):
+        """
+        Send a request through the circuit breaker and rate limiter when configured.
+        
+        ``endpoint`` is the path template (e.g. "/webhooks/{webhook_id}") that
+        keys the circuit breaker; it defaults to ``path`` for paths without IDs.
+        """
+        breaker = self._circuit_breaker
+        circuit = breaker.before(method, endpoint or path) if breaker is not None else None
+        limiter = self._rate_limiter
+        if limiter is not None:
+            limiter.acquire()
+            started = time.monotonic()
+        if method == "POST":
+            # Lets the server de-duplicate POSTs replayed by the retry policy,
+            # including body-less ones such as test_webhook
+            headers = {**(headers or {}), "Idempotency-Key": uuid.uuid4().hex}
+        response = None
+        try:
+            if json is None:
+                response = self.session.request(method, path, params=params, headers=headers)
+            else:
+                response = self._send_json(method, path, json, params, headers)
+            return response
+        finally:
+            if limiter is not None:
+                limiter.release(response, time.monotonic() - started)
+            if breaker is not None:
+                breaker.record(circuit, response is not None and response.status_code < 500)
+    
+    def _call(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: Optional[Dict] = None,
+        parse_json: bool = True,
+        endpoint: Optional[str] = None
+    ) -> Any:
+        """Send a request, raise on HTTP errors and return the decoded body."""
+        response = self._request(method, path, json=json, params=params, endpoint=endpoint)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "MemoryClient %s %s: status=%s response_len=%d",
+                method, path, response.status_code, len(response.content)
+            )
+        return self._handle(response, parse_json)
+    
+    def _handle(self, response, parse_json: bool = True) -> Any:
+        """Raise MemphoraHTTPError for error statuses, otherwise return the decoded body."""
+        if response.status_code >= 400:
+            raise MemphoraHTTPError.from_response(response)
+        return self._decode(response) if parse_json else None
+    
+    def _decode(self, response) -> Any:
+        """Decode a response body as msgpack or JSON according to its Content-Type."""
+        if self._msgpack is not None and response.headers.get("Content-Type", "").startswith(_MSGPACK_TYPE):
+            return self._msgpack.unpackb(response.content, raw=False)
+        return json_codec.loads(response.content)
+    
+    @contextmanager
+    def _stream_get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None
+    ) -> Iterator[Iterator[bytes]]:
+        """Stream a GET response, yielding an iterator over its decoded body chunks."""
+        if self.transport == "httpx":
+            with self.session.stream("GET", url, params=params, headers=headers) as response:
+                self._handle(response, parse_json=False)
+                yield response.iter_bytes(self.STREAM_CHUNK_SIZE)
+        else:
+            with self.session.get(url, params=params, headers=headers, stream=True) as response:
+                self._handle(response, parse_json=False)
+                yield response.iter_content(self.STREAM_CHUNK_SIZE)
+    
+    def _cached_get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        ttl: Optional[float] = None,
+        endpoint: Optional[str] = None
+    ):
+        """GET ``url`` and return the decoded body, using the response and ETag caches when enabled.
+        
+        ``ttl`` overrides the response cache's default lifetime for this endpoint.
+        Responses marked ``Cache-Control: no-store`` are never kept. 404s are
+        cached too, so repeated lookups of a missing ID re-raise locally.
+        """
+        cache = self._response_cache
+        key = (url, frozenset(params.items()) if params else None)
+        if cache is not None:
+            cached = cache.get(key, _MISSING)
+            if isinstance(cached, _NotFound):
+                # A fresh error each time, so tracebacks don't pile up on a shared instance
+                raise MemphoraHTTPError.from_response(cached.response)
+            if cached is not _MISSING:
+                return cached
+        etags = self._etag_cache
+        validated = etags.get(key) if etags is not None else None
+        response = self._request(
+            "GET",
+            url,
+            params=params,
+            headers={"If-None-Match": validated[0]} if validated else None,
+            endpoint=endpoint
+        )
+        if validated and response.status_code == 304:
+            result = validated[1]
+        else:
+            try:
+                result = self._handle(response)
+            except MemphoraHTTPError as e:
+                if cache is not None and e.status_code == 404:
+                    cache.set(key, _NotFound(response), ttl=ttl)
+                raise
+            if "no-store" in response.headers.get("Cache-Control", "").lower():
+                return result
+            etag = response.headers.get("ETag") if etags is not None else None
+            if etag:
+                etags.set(key, (etag, result))
+        if cache is not None:
+            cache.set(key, result, ttl=ttl)
+        return result
+    
+    def _invalidate_caches(
+        self,
+        user_id: Optional[str] = None,
+        memory_id: Optional[str] = None,
+        linked_ids: Iterable[str] = (),
+        graph: bool = False
+    ) -> None:
+        """
+        Drop cached responses a write may have made stale.
+        
+        ``linked_ids`` are other memories the write linked to, whose context and
+        path responses change too; ``graph`` drops every cached context and path
+        response, for writes that link to memories not known here. With neither
+        ID known every cached response is dropped.
+        """
+        if self._semantic_cache is not None:
+            self._semantic_cache.invalidate(user_id)
+        cache = self._response_cache
+        if cache is None:
+            return
+        if user_id is None and memory_id is None:
+            cache.clear()
+            return
+        fragments = ["/statistics"]
+        if user_id is not None:
+            fragments.append(f"/{user_id}")
+        if memory_id is not None:
+            # The owning user is unknown, so drop every per-user listing as well
+            fragments.extend([f"/{memory_id}", "/memories/user/", "/users/"])
+        fragments.extend(f"/{linked_id}" for linked_id in linked_ids)
+        if graph:
+            fragments.extend(["/context", "/path/"])
+        cache.invalidate(lambda key: any(f in key[0] for f in fragments))
+    
+    def _invalidate_path(self, prefix: str) -> None:
+        """Drop cached responses and stored ETags for URLs under ``prefix``."""
+        for cache in (self._response_cache, self._etag_cache):
+            if cache is not None:
+                cache.invalidate(lambda key: key[0].startswith(prefix))
     
     def add_memory(
         self,
@@ -62,16 +509,20 @@ class MemoryClient:
         Returns:
             Created memory dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/memories",
-            json={
-                "user_id": user_id,
-                "content": content,
-                "metadata": metadata or {}
-            }
+        payload = {
+            "user_id": user_id,
+            "content": content
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        
+        result = self._call(
+            "POST",
+            "/memories",
+            json=payload
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     def get_memory(self, memory_id: str) -> Dict:
         """
@@ -83,9 +534,7 @@ class MemoryClient:
         Returns:
             Memory dictionary
         """
-        response = self.session.get(f"{self.base_url}/memories/{memory_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"/memories/{memory_id}", endpoint="/memories/{memory_id}")
     
     def get_user_memories(self, user_id: str, limit: int = 100) -> List[Dict]:
         """
@@ -98,12 +547,51 @@ class MemoryClient:
         Returns:
             List of memory dictionaries
         """
-        response = self.session.get(
-            f"{self.base_url}/memories/user/{user_id}",
+        return self._cached_get(
+            f"/memories/user/{user_id}",
+            endpoint="/memories/user/{user_id}",
             params={"limit": limit}
         )
-        response.raise_for_status()
-        return response.json()
+    
+    def get_user_memories_iter(self, user_id: str, limit: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over a user's memories while the response is still downloading.
+        
+        Unlike get_user_memories, the JSON array is decoded incrementally so only
+        one memory is held in memory at a time. Requires ijson:
+        pip install memphora[streaming]
+        
+        Args:
+            user_id: ID of the user
+            limit: Maximum number of memories to return
+        
+        Yields:
+            Memory dictionaries
+        """
+        return self._iter_json_array(f"/memories/user/{user_id}", {"limit": limit})
+    
+    def _iter_json_array(self, url: str, params: Optional[Dict] = None) -> Iterator[Any]:
+        """Stream a GET whose body is a JSON array, yielding items as they are decoded."""
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError(
+                "Streaming iterators require ijson. Install with: pip install memphora[streaming]"
+            )
+        events = ijson.sendable_list()
+        parser = ijson.items_coro(events, "item", use_float=True)
+        with self._stream_get(
+            url,
+            params=params,
+            # ijson parses JSON only, whatever the configured wire format
+            headers={"Accept": "application/json"}
+        ) as chunks:
+            for chunk in chunks:
+                parser.send(chunk)
+                yield from events
+                del events[:]
+        parser.close()
+        yield from events
     
     def search_memories(
         self,
@@ -113,7 +601,8 @@ class MemoryClient:
         rerank: bool = False,
         rerank_provider: str = "auto",
         cohere_api_key: Optional[str] = None,
-        jina_api_key: Optional[str] = None
+        jina_api_key: Optional[str] = None,
+        bypass_cache: bool = False
     ) -> List[Dict]:
         """
         Search memories semantically with optional external reranking.
@@ -126,6 +615,7 @@ class MemoryClient:
             rerank_provider: Reranking provider ("cohere", "jina", or "auto")
             cohere_api_key: Optional Cohere API key (if not configured on backend)
             jina_api_key: Optional Jina AI API key (if not configured on backend)
+            bypass_cache: Skip the client-side semantic cache lookup for this call
         
         Returns:
             List of matching memory dictionaries
@@ -143,15 +633,13 @@ class MemoryClient:
         if jina_api_key:
             payload["jina_api_key"] = jina_api_key
         
-        url = f"{self.base_url}/memories/search"
-        import logging
-        logging.getLogger(__name__).debug(f"MemoryClient.search_memories: POST {url} with user_id={user_id}, query={query[:50] if query else ''}")
-        response = self.session.post(url, json=payload)
-        logging.getLogger(__name__).debug(f"MemoryClient.search_memories: status={response.status_code}, response_len={len(response.text)}")
-        response.raise_for_status()
-        result = response.json()
-        logging.getLogger(__name__).debug(f"MemoryClient.search_memories: returned {len(result) if isinstance(result, list) else 'non-list'} items")
-        return result
+        def fetch():
+            return self._call("POST", "/memories/search", json=payload)
+        
+        if self._semantic_cache is None:
+            return fetch()
+        scope = (user_id, "search", limit, rerank, rerank_provider)
+        return self._semantic_cache.get_or_fetch(scope, query, fetch, refresh=bypass_cache)
     
     def update_memory(
         self,
@@ -176,12 +664,14 @@ class MemoryClient:
         if metadata is not None:
             update_data["metadata"] = metadata
         
-        response = self.session.put(
-            f"{self.base_url}/memories/{memory_id}",
+        result = self._call(
+            "PUT",
+            f"/memories/{memory_id}",
+            endpoint="/memories/{memory_id}",
             json=update_data
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(memory_id=memory_id)
+        return result
     
     def delete_memory(self, memory_id: str) -> bool:
         """
@@ -193,8 +683,13 @@ class MemoryClient:
         Returns:
             True if successful
         """
-        response = self.session.delete(f"{self.base_url}/memories/{memory_id}")
-        response.raise_for_status()
+        self._call(
+            "DELETE",
+            f"/memories/{memory_id}",
+            endpoint="/memories/{memory_id}",
+            parse_json=False
+        )
+        self._invalidate_caches(memory_id=memory_id)
         return True
     
     def extract_from_conversation(
@@ -213,15 +708,16 @@ class MemoryClient:
         Returns:
             List of extracted and stored memory dictionaries
         """
-        response = self.session.post(
-            f"{self.base_url}/conversations/extract",
+        result = self._call(
+            "POST",
+            "/conversations/extract",
             json={
                 "user_id": user_id,
                 "conversation": conversation
             }
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     def extract_from_content(
         self,
@@ -241,16 +737,20 @@ class MemoryClient:
         Returns:
             List of extracted and stored memory dictionaries
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/extract",
-            json={
-                "user_id": user_id,
-                "content": content,
-                "metadata": metadata or {}
-            }
+        payload = {
+            "user_id": user_id,
+            "content": content
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        
+        result = self._call(
+            "POST",
+            "/memories/extract",
+            json=payload
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     # Advanced Memory Operations
     def create_advanced_memory(
@@ -272,17 +772,22 @@ class MemoryClient:
         Returns:
             Created memory dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/advanced",
-            json={
-                "user_id": user_id,
-                "content": content,
-                "metadata": metadata or {},
-                "link_to": link_to or []
-            }
+        payload = {
+            "user_id": user_id,
+            "content": content
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        if link_to:
+            payload["link_to"] = link_to
+        
+        result = self._call(
+            "POST",
+            "/memories/advanced",
+            json=payload
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id, linked_ids=link_to or ())
+        return result
     
     def search_advanced(
         self,
@@ -309,20 +814,22 @@ class MemoryClient:
         Returns:
             List of matching memory dictionaries
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/search/advanced",
-            json={
-                "user_id": user_id,
-                "query": query,
-                "limit": limit,
-                "filters": filters or {},
-                "include_related": include_related,
-                "min_score": min_score,
-                "sort_by": sort_by
-            }
+        payload = {
+            "user_id": user_id,
+            "query": query,
+            "limit": limit,
+            "include_related": include_related,
+            "min_score": min_score,
+            "sort_by": sort_by
+        }
+        if filters:
+            payload["filters"] = filters
+        
+        return self._call(
+            "POST",
+            "/memories/search/advanced",
+            json=payload
         )
-        response.raise_for_status()
-        return response.json()
     
     def batch_create(
         self,
@@ -341,16 +848,38 @@ class MemoryClient:
         Returns:
             List of created memory dictionaries
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/batch",
+        result = self._call(
+            "POST",
+            "/memories/batch",
             json={
                 "user_id": user_id,
                 "memories": memories,
                 "link_related": link_related
             }
         )
-        response.raise_for_status()
-        return response.json()
+        # Related memories the server linked the new ones to aren't known here
+        self._invalidate_caches(user_id, graph=link_related)
+        return result
+    
+    def buffered(
+        self,
+        max_batch: int = 100,
+        max_wait_ms: float = 50,
+        link_related: bool = True
+    ) -> BufferedWriter:
+        """
+        Return a writer that coalesces individual memory writes into batch requests.
+        
+        Args:
+            max_batch: Number of buffered memories per user that triggers a batch
+            max_wait_ms: Maximum time a memory waits before its batch is sent
+            link_related: Automatically link related memories
+        
+        Returns:
+            BufferedWriter usable as a context manager; created memories are
+            collected in its ``results`` list
+        """
+        return BufferedWriter(self, max_batch=max_batch, max_wait_ms=max_wait_ms, link_related=link_related)
     
     def merge_memories(
         self,
@@ -367,15 +896,16 @@ class MemoryClient:
         Returns:
             Merged memory dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/merge",
+        result = self._call(
+            "POST",
+            "/memories/merge",
             json={
                 "memory_ids": memory_ids,
                 "merge_strategy": merge_strategy
             }
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches()
+        return result
     
     def find_contradictions(
         self,
@@ -392,12 +922,12 @@ class MemoryClient:
         Returns:
             List of potentially contradictory memories
         """
-        response = self.session.get(
-            f"{self.base_url}/memories/{memory_id}/contradictions",
+        return self._call(
+            "GET",
+            f"/memories/{memory_id}/contradictions",
+            endpoint="/memories/{memory_id}/contradictions",
             params={"similarity_threshold": similarity_threshold}
         )
-        response.raise_for_status()
-        return response.json()
     
     def link_memories(
         self,
@@ -416,15 +946,17 @@ class MemoryClient:
         Returns:
             Relationship information
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/{memory_id}/link",
+        result = self._call(
+            "POST",
+            f"/memories/{memory_id}/link",
+            endpoint="/memories/{memory_id}/link",
             params={
                 "target_id": target_id,
                 "relationship_type": relationship_type
             }
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(memory_id=memory_id, linked_ids=[target_id])
+        return result
     
     def get_memory_context(
         self,
@@ -441,12 +973,11 @@ class MemoryClient:
         Returns:
             Context dictionary with related memories
         """
-        response = self.session.get(
-            f"{self.base_url}/memories/{memory_id}/context",
+        return self._cached_get(
+            f"/memories/{memory_id}/context",
+            endpoint="/memories/{memory_id}/context",
             params={"depth": depth}
         )
-        response.raise_for_status()
-        return response.json()
     
     def find_memory_path(
         self,
@@ -463,11 +994,10 @@ class MemoryClient:
         Returns:
             Path information with memory details
         """
-        response = self.session.get(
-            f"{self.base_url}/memories/{source_id}/path/{target_id}"
+        return self._cached_get(
+            f"/memories/{source_id}/path/{target_id}",
+            endpoint="/memories/{source_id}/path/{target_id}"
         )
-        response.raise_for_status()
-        return response.json()
     
     # Export/Import
     def export_memories(
@@ -485,12 +1015,41 @@ class MemoryClient:
         Returns:
             Export data with format information
         """
-        response = self.session.get(
-            f"{self.base_url}/users/{user_id}/export",
+        return self._cached_get(
+            f"/users/{user_id}/export",
+            endpoint="/users/{user_id}/export",
             params={"format": format}
         )
-        response.raise_for_status()
-        return response.json()
+    
+    def export_memories_to_file(
+        self,
+        user_id: str,
+        path: str,
+        format: str = "json"
+    ) -> int:
+        """
+        Export all memories for a user straight to a file.
+        
+        The response is streamed to disk in chunks rather than buffered and
+        decoded, so memory use stays constant for large histories.
+        
+        Args:
+            user_id: ID of the user
+            path: Destination file path
+            format: Export format ("json" or "csv")
+        
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with self._stream_get(
+            f"/users/{user_id}/export",
+            params={"format": format}
+        ) as chunks, open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+        return written
     
     def import_memories(
         self,
@@ -509,13 +1068,15 @@ class MemoryClient:
         Returns:
             Import result with count and memories
         """
-        response = self.session.post(
-            f"{self.base_url}/users/{user_id}/import",
-            params={"format": format},
-            json={"data": data}
+        result = self._call(
+            "POST",
+            f"/users/{user_id}/import",
+            endpoint="/users/{user_id}/import",
+            json={"data": data},
+            params={"format": format}
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     # Statistics
     def get_user_statistics(self, user_id: str) -> Dict:
@@ -528,11 +1089,10 @@ class MemoryClient:
         Returns:
             Statistics dictionary
         """
-        response = self.session.get(
-            f"{self.base_url}/users/{user_id}/statistics"
+        return self._cached_get(
+            f"/users/{user_id}/statistics",
+            endpoint="/users/{user_id}/statistics"
         )
-        response.raise_for_status()
-        return response.json()
     
     def get_global_statistics(self) -> Dict:
         """
@@ -541,9 +1101,7 @@ class MemoryClient:
         Returns:
             Global statistics dictionary
         """
-        response = self.session.get(f"{self.base_url}/statistics")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("/statistics")
     
     def delete_all_user_memories(self, user_id: str) -> Dict:
         """
@@ -555,11 +1113,13 @@ class MemoryClient:
         Returns:
             Deletion result with count
         """
-        response = self.session.delete(
-            f"{self.base_url}/users/{user_id}/memories"
+        result = self._call(
+            "DELETE",
+            f"/users/{user_id}/memories",
+            endpoint="/users/{user_id}/memories"
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     def set_retention_policy(
         self,
@@ -582,8 +1142,9 @@ class MemoryClient:
         Returns:
             Created policy dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/security/retention-policies",
+        return self._call(
+            "POST",
+            "/security/retention-policies",
             json={
                 "data_type": data_type,
                 "retention_days": retention_days,
@@ -592,8 +1153,6 @@ class MemoryClient:
                 "auto_delete": auto_delete
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     def apply_retention_policies(
         self,
@@ -616,12 +1175,13 @@ class MemoryClient:
         if user_id:
             params["user_id"] = user_id
         
-        response = self.session.post(
-            f"{self.base_url}/security/apply-retention",
+        result = self._call(
+            "POST",
+            "/security/apply-retention",
             params=params
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches()
+        return result
     
     # Memory Versioning
     def get_memory_versions(self, memory_id: str, limit: int = 50) -> List[Dict]:
@@ -635,12 +1195,11 @@ class MemoryClient:
         Returns:
             List of version dictionaries
         """
-        response = self.session.get(
-            f"{self.base_url}/memories/{memory_id}/versions",
+        return self._cached_get(
+            f"/memories/{memory_id}/versions",
+            endpoint="/memories/{memory_id}/versions",
             params={"limit": limit}
         )
-        response.raise_for_status()
-        return response.json()
     
     def get_version(self, version_id: str) -> Dict:
         """
@@ -652,9 +1211,7 @@ class MemoryClient:
         Returns:
             Version dictionary
         """
-        response = self.session.get(f"{self.base_url}/versions/{version_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"/versions/{version_id}", endpoint="/versions/{version_id}")
     
     def get_version_history(
         self,
@@ -679,12 +1236,12 @@ class MemoryClient:
         if to_version is not None:
             params["to_version"] = to_version
         
-        response = self.session.get(
-            f"{self.base_url}/memories/{memory_id}/history",
+        return self._call(
+            "GET",
+            f"/memories/{memory_id}/history",
+            endpoint="/memories/{memory_id}/history",
             params=params
         )
-        response.raise_for_status()
-        return response.json()
     
     def rollback_memory(
         self,
@@ -703,13 +1260,15 @@ class MemoryClient:
         Returns:
             Rollback result
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/{memory_id}/rollback",
-            params={"user_id": user_id},
-            json={"target_version": target_version}
+        result = self._call(
+            "POST",
+            f"/memories/{memory_id}/rollback",
+            endpoint="/memories/{memory_id}/rollback",
+            json={"target_version": target_version},
+            params={"user_id": user_id}
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(memory_id=memory_id)
+        return result
     
     def compare_versions(
         self,
@@ -726,15 +1285,14 @@ class MemoryClient:
         Returns:
             Comparison result
         """
-        response = self.session.get(
-            f"{self.base_url}/versions/compare",
+        return self._call(
+            "GET",
+            "/versions/compare",
             params={
                 "version_id_1": version_id_1,
                 "version_id_2": version_id_2
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     # Conversation Features
     def record_conversation(
@@ -756,17 +1314,21 @@ class MemoryClient:
         Returns:
             Recorded conversation dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/conversations/record",
-            json={
-                "user_id": user_id,
-                "conversation": conversation,
-                "platform": platform or "unknown",
-                "metadata": metadata or {}
-            }
+        payload = {
+            "user_id": user_id,
+            "conversation": conversation,
+            "platform": platform or "unknown"
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        
+        result = self._call(
+            "POST",
+            "/conversations/record",
+            json=payload
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     def get_conversation(self, conversation_id: str) -> Dict:
         """
@@ -778,11 +1340,10 @@ class MemoryClient:
         Returns:
             Conversation dictionary
         """
-        response = self.session.get(
-            f"{self.base_url}/conversations/{conversation_id}"
+        return self._cached_get(
+            f"/conversations/{conversation_id}",
+            endpoint="/conversations/{conversation_id}"
         )
-        response.raise_for_status()
-        return response.json()
     
     def get_user_conversations(
         self,
@@ -805,12 +1366,38 @@ class MemoryClient:
         if platform:
             params["platform"] = platform
         
-        response = self.session.get(
-            f"{self.base_url}/conversations/user/{user_id}",
+        return self._call(
+            "GET",
+            f"/conversations/user/{user_id}",
+            endpoint="/conversations/user/{user_id}",
             params=params
         )
-        response.raise_for_status()
-        return response.json()
+    
+    def get_user_conversations_iter(
+        self,
+        user_id: str,
+        platform: Optional[str] = None,
+        limit: int = 50
+    ) -> Iterator[Dict]:
+        """
+        Iterate over a user's conversations while the response is still downloading.
+        
+        Like get_user_memories_iter, only one conversation is decoded and held
+        at a time. Requires ijson: pip install memphora[streaming]
+        
+        Args:
+            user_id: ID of the user
+            platform: Optional platform filter
+            limit: Maximum number of conversations
+        
+        Yields:
+            Conversation dictionaries
+        """
+        params = {"limit": limit}
+        if platform:
+            params["platform"] = platform
+        
+        return self._iter_json_array(f"/conversations/user/{user_id}", params)
     
     def summarize_conversation(
         self,
@@ -827,15 +1414,14 @@ class MemoryClient:
         Returns:
             Summary dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/conversations/summarize",
+        return self._call(
+            "POST",
+            "/conversations/summarize",
             json={
                 "conversation": conversation,
                 "summary_type": summary_type
             }
         )
-        response.raise_for_status()
-        return response.json()
     
     # Performance Features
     def search_optimized(
@@ -845,7 +1431,8 @@ class MemoryClient:
         max_tokens: int = 2000,
         max_memories: int = 20,
         use_compression: bool = True,
-        use_cache: bool = True
+        use_cache: bool = True,
+        bypass_cache: bool = False
     ) -> Dict:
         """
         Optimized memory search (26% better accuracy, 91% faster).
@@ -856,24 +1443,30 @@ class MemoryClient:
             max_tokens: Maximum token budget
             max_memories: Maximum number of memories
             use_compression: Enable context compression
-            use_cache: Use cached results
+            use_cache: Use cached results (server-side)
+            bypass_cache: Skip the client-side semantic cache lookup for this call
         
         Returns:
             Optimized context with performance metrics
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/search/optimized",
-            json={
-                "user_id": user_id,
-                "query": query,
-                "max_tokens": max_tokens,
-                "max_memories": max_memories,
-                "use_compression": use_compression,
-                "use_cache": use_cache
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+        def fetch():
+            return self._call(
+                "POST",
+                "/memories/search/optimized",
+                json={
+                    "user_id": user_id,
+                    "query": query,
+                    "max_tokens": max_tokens,
+                    "max_memories": max_memories,
+                    "use_compression": use_compression,
+                    "use_cache": use_cache
+                }
+            )
+        
+        if self._semantic_cache is None:
+            return fetch()
+        scope = (user_id, "search_optimized", max_tokens, max_memories, use_compression, use_cache)
+        return self._semantic_cache.get_or_fetch(scope, query, fetch, refresh=bypass_cache)
     
     def search_enhanced(
         self,
@@ -881,7 +1474,8 @@ class MemoryClient:
         query: str,
         max_tokens: int = 2000,
         max_memories: int = 20,
-        use_compression: bool = True
+        use_compression: bool = True,
+        bypass_cache: bool = False
     ) -> Dict:
         """
         Enhanced search with maximum performance (>35% accuracy improvement).
@@ -892,22 +1486,28 @@ class MemoryClient:
             max_tokens: Maximum token budget
             max_memories: Maximum number of memories
             use_compression: Enable context compression
+            bypass_cache: Skip the client-side semantic cache lookup for this call
         
         Returns:
             Enhanced context with performance metrics
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/search/enhanced",
-            json={
-                "user_id": user_id,
-                "query": query,
-                "max_tokens": max_tokens,
-                "max_memories": max_memories,
-                "use_compression": use_compression
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+        def fetch():
+            return self._call(
+                "POST",
+                "/memories/search/enhanced",
+                json={
+                    "user_id": user_id,
+                    "query": query,
+                    "max_tokens": max_tokens,
+                    "max_memories": max_memories,
+                    "use_compression": use_compression
+                }
+            )
+        
+        if self._semantic_cache is None:
+            return fetch()
+        scope = (user_id, "search_enhanced", max_tokens, max_memories, use_compression)
+        return self._semantic_cache.get_or_fetch(scope, query, fetch, refresh=bypass_cache)
     
     # Text Features
     def concise_text(self, text: str) -> Dict:
@@ -920,12 +1520,11 @@ class MemoryClient:
         Returns:
             Concise text result
         """
-        response = self.session.post(
-            f"{self.base_url}/text/conciser",
+        return self._call(
+            "POST",
+            "/text/conciser",
             json={"text": text}
         )
-        response.raise_for_status()
-        return response.json()
     
     # Multimodal Features
     def store_image(
@@ -949,23 +1548,27 @@ class MemoryClient:
         Returns:
             Created image memory dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/image",
-            json={
-                "user_id": user_id,
-                "image_url": image_url,
-                "image_base64": image_base64,
-                "description": description,
-                "metadata": metadata or {}
-            }
+        payload = {
+            "user_id": user_id,
+            "image_url": image_url,
+            "image_base64": image_base64,
+            "description": description
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        
+        result = self._call(
+            "POST",
+            "/memories/image",
+            json=payload
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     def upload_image(
         self,
         user_id: str,
-        image_data: bytes,
+        image_data: Union[bytes, BinaryIO],
         filename: str,
         metadata: Optional[Dict] = None
     ) -> Dict:
@@ -974,23 +1577,67 @@ class MemoryClient:
         
         Args:
             user_id: ID of the user
-            image_data: Image file data (bytes)
+            image_data: Image file data (bytes) or a binary file object.
+                File objects are streamed in chunks with the httpx transport,
+                or with requests when requests-toolbelt is installed.
             filename: Image filename
             metadata: Optional metadata dictionary
         
         Returns:
             Uploaded image memory dictionary
         """
-        files = {"file": (filename, image_data)}
         # user_id is sent as query parameter, not form data
         # metadata can be sent as form data if needed, but backend doesn't use it from form
-        response = self.session.post(
-            f"{self.base_url}/memories/image/upload",
-            params={"user_id": user_id},
-            files=files
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._upload_file("/memories/image/upload", {"user_id": user_id}, filename, image_data)
+    
+    def upload_document(
+        self,
+        user_id: str,
+        file_data: Union[bytes, BinaryIO],
+        filename: str
+    ) -> Dict:
+        """
+        Upload a document (PDF, image, text, markdown, JSON, CSV, ...) and create memories.
+        
+        Args:
+            user_id: ID of the user
+            file_data: File contents (bytes) or a binary file object, streamed
+                like upload_image
+            filename: Filename with extension; selects how the file is processed
+        
+        Returns:
+            Dict with job_id for tracking (async processing)
+        """
+        return self._upload_file("/documents/upload", {"user_id": user_id}, filename, file_data)
+    
+    def _upload_file(
+        self,
+        url: str,
+        params: Dict,
+        filename: str,
+        data: Union[bytes, BinaryIO]
+    ) -> Dict:
+        """POST a single-file multipart upload for ``params["user_id"]``, streaming file objects when possible."""
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        field = (filename, data, content_type)
+        try:
+            from requests_toolbelt.multipart.encoder import MultipartEncoder
+        except ImportError:
+            # Streaming multipart uploads need: pip install memphora[streaming]
+            MultipartEncoder = None
+        if self.transport == "requests" and MultipartEncoder is not None:
+            encoder = MultipartEncoder(fields={"file": field})
+            response = self.session.post(
+                url,
+                params=params,
+                data=encoder,
+                headers={"Content-Type": encoder.content_type}
+            )
+        else:
+            response = self.session.post(url, params=params, files={"file": field})
+        result = self._handle(response)
+        self._invalidate_caches(params["user_id"])
+        return result
     
     def search_images(
         self,
@@ -1009,12 +1656,11 @@ class MemoryClient:
         Returns:
             List of matching image memories
         """
-        response = self.session.post(
-            f"{self.base_url}/memories/image/search",
+        return self._call(
+            "POST",
+            "/memories/image/search",
             json={"user_id": user_id, "query": query, "limit": limit}
         )
-        response.raise_for_status()
-        return response.json()
     
     # Security & Compliance
     def export_gdpr(self, user_id: str) -> Dict:
@@ -1027,11 +1673,11 @@ class MemoryClient:
         Returns:
             GDPR export data
         """
-        response = self.session.get(
-            f"{self.base_url}/security/compliance/gdpr/export/{user_id}"
+        return self._call(
+            "GET",
+            f"/security/compliance/gdpr/export/{user_id}",
+            endpoint="/security/compliance/gdpr/export/{user_id}"
         )
-        response.raise_for_status()
-        return response.json()
     
     def delete_gdpr(self, user_id: str) -> Dict:
         """
@@ -1043,11 +1689,13 @@ class MemoryClient:
         Returns:
             Deletion confirmation
         """
-        response = self.session.delete(
-            f"{self.base_url}/security/compliance/gdpr/delete/{user_id}"
+        result = self._call(
+            "DELETE",
+            f"/security/compliance/gdpr/delete/{user_id}",
+            endpoint="/security/compliance/gdpr/delete/{user_id}"
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_caches(user_id)
+        return result
     
     def record_compliance_event(
         self,
@@ -1056,7 +1704,8 @@ class MemoryClient:
         user_id: Optional[str] = None,
         organization_id: Optional[str] = None,
         data_subject_id: Optional[str] = None,
-        details: Optional[Dict] = None
+        details: Optional[Dict] = None,
+        buffered: bool = False
     ) -> Dict:
         """
         Record a compliance event.
@@ -1068,23 +1717,82 @@ class MemoryClient:
             organization_id: Optional organization ID
             data_subject_id: Optional data subject ID (for GDPR)
             details: Optional additional details
+            buffered: Queue the event and send it with others in one batch
+                request (within 0.5s, or on flush_compliance_events())
         
         Returns:
-            Event recording confirmation
+            Event recording confirmation ({"status": "queued"} when buffered)
         """
-        response = self.session.post(
-            f"{self.base_url}/security/compliance-events",
-            json={
-                "compliance_type": compliance_type,
-                "event_type": event_type,
-                "user_id": user_id,
-                "organization_id": organization_id,
-                "data_subject_id": data_subject_id,
-                "details": details or {}
-            }
+        if buffered:
+            if self._compliance_buffer is None:
+                self._compliance_buffer = ComplianceEventBuffer(self)
+            self._compliance_buffer.add(
+                compliance_type, event_type, user_id, organization_id, data_subject_id, details
+            )
+            return {"status": "queued"}
+        
+        payload = {
+            "compliance_type": compliance_type,
+            "event_type": event_type,
+            "user_id": user_id,
+            "organization_id": organization_id,
+            "data_subject_id": data_subject_id
+        }
+        if details:
+            payload["details"] = details
+        
+        result = self._call(
+            "POST",
+            "/security/compliance-events",
+            json=payload
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_path("/security/compliance/report")
+        return result
+    
+    def record_compliance_events_batch(self, events: List[Dict]) -> List[Dict]:
+        """
+        Record several compliance events in one request.
+        
+        Args:
+            events: List of event dictionaries with the record_compliance_event fields
+        
+        Returns:
+            List of event recording confirmations
+        """
+        result = self._call("POST", "/security/compliance-events/batch", json=events)
+        self._invalidate_path("/security/compliance/report")
+        return result
+    
+    def compliance_event_buffer(self, max_batch: int = 256, flush_interval: float = 0.5) -> ComplianceEventBuffer:
+        """
+        Return a buffer that coalesces compliance events into batch requests.
+        
+        Args:
+            max_batch: Number of buffered events that triggers a batch
+            flush_interval: Maximum seconds an event waits before its batch is sent
+        
+        Returns:
+            ComplianceEventBuffer usable as a context manager
+        """
+        return ComplianceEventBuffer(self, max_batch=max_batch, flush_interval=flush_interval)
+    
+    def flush_compliance_events(self) -> None:
+        """Send compliance events queued with record_compliance_event(buffered=True)."""
+        if self._compliance_buffer is not None:
+            self._compliance_buffer.flush()
+    
+    def get_data_key(self, key_id: Optional[str] = None) -> Dict:
+        """
+        Get a data encryption key for client-side encryption.
+        
+        Args:
+            key_id: ID of a previously issued key; omit for the current key
+        
+        Returns:
+            Dictionary with key_id and base64-encoded 256-bit key
+        """
+        params = {"key_id": key_id} if key_id else None
+        return self._call("GET", "/security/data-key", params=params)
     
     def encrypt_data(self, data: str) -> Dict:
         """
@@ -1094,31 +1802,35 @@ class MemoryClient:
             data: Data string to encrypt
         
         Returns:
-            Dictionary with encrypted data
+            Dictionary with encrypted data (and key_id with local_encryption)
         """
-        response = self.session.post(
-            f"{self.base_url}/security/encrypt",
+        if self._cipher is not None:
+            return self._cipher.encrypt(data)
+        return self._call(
+            "POST",
+            "/security/encrypt",
             json={"data": data}
         )
-        response.raise_for_status()
-        return response.json()
     
-    def decrypt_data(self, encrypted_data: str) -> Dict:
+    def decrypt_data(self, encrypted_data: str, key_id: Optional[str] = None) -> Dict:
         """
         Decrypt data.
         
         Args:
             encrypted_data: Encrypted data string
+            key_id: Key ID returned by a local encrypt_data; decrypts on the
+                client when local_encryption is enabled
         
         Returns:
             Dictionary with decrypted data
         """
-        response = self.session.post(
-            f"{self.base_url}/security/decrypt",
+        if self._cipher is not None and key_id:
+            return self._cipher.decrypt(encrypted_data, key_id)
+        return self._call(
+            "POST",
+            "/security/decrypt",
             json={"encrypted_data": encrypted_data}
         )
-        response.raise_for_status()
-        return response.json()
     
     def get_compliance_report(
         self,
@@ -1139,12 +1851,12 @@ class MemoryClient:
         if compliance_type:
             params["compliance_type"] = compliance_type
         
-        response = self.session.get(
-            f"{self.base_url}/security/compliance/report/{organization_id}",
-            params=params
+        return self._cached_get(
+            f"/security/compliance/report/{organization_id}",
+            endpoint="/security/compliance/report/{organization_id}",
+            params=params,
+            ttl=60
         )
-        response.raise_for_status()
-        return response.json()
     
     # Health Check
     def health_check(self) -> Dict:
@@ -1154,9 +1866,7 @@ class MemoryClient:
         Returns:
             Health status dictionary
         """
-        response = self.session.get(f"{self.base_url}/health")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("/health", ttl=5)
     
     # Webhooks
     def create_webhook(
@@ -1176,16 +1886,17 @@ class MemoryClient:
         Returns:
             Created webhook dictionary
         """
-        response = self.session.post(
-            f"{self.base_url}/webhooks",
+        result = self._call(
+            "POST",
+            "/webhooks",
             json={
                 "url": url,
                 "events": events,
                 "secret": secret
             }
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_path("/webhooks")
+        return result
     
     def list_webhooks(self, user_id: Optional[str] = None) -> List[Dict]:
         """
@@ -1201,12 +1912,10 @@ class MemoryClient:
         if user_id:
             params["user_id"] = user_id
         
-        response = self.session.get(
-            f"{self.base_url}/webhooks",
+        return self._cached_get(
+            "/webhooks",
             params=params
         )
-        response.raise_for_status()
-        return response.json()
     
     def get_webhook(self, webhook_id: str) -> Dict:
         """
@@ -1218,9 +1927,7 @@ class MemoryClient:
         Returns:
             Webhook dictionary
         """
-        response = self.session.get(f"{self.base_url}/webhooks/{webhook_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"/webhooks/{webhook_id}", endpoint="/webhooks/{webhook_id}")
     
     def update_webhook(
         self,
@@ -1243,22 +1950,20 @@ class MemoryClient:
         Returns:
             Updated webhook dictionary
         """
-        update_data = {}
-        if url is not None:
-            update_data["url"] = url
-        if events is not None:
-            update_data["events"] = events
-        if secret is not None:
-            update_data["secret"] = secret
-        if active is not None:
-            update_data["active"] = active
-        
-        response = self.session.put(
-            f"{self.base_url}/webhooks/{webhook_id}",
+        update_data = {
+            key: value
+            for key, value in (("url", url), ("events", events), ("secret", secret), ("active", active))
+            if value is not None
+        }
+        
+        result = self._call(
+            "PUT",
+            f"/webhooks/{webhook_id}",
+            endpoint="/webhooks/{webhook_id}",
             json=update_data
         )
-        response.raise_for_status()
-        return response.json()
+        self._invalidate_path("/webhooks")
+        return result
     
     def delete_webhook(self, webhook_id: str) -> Dict:
         """
@@ -1270,9 +1975,13 @@ class MemoryClient:
         Returns:
             Deletion confirmation
         """
-        response = self.session.delete(f"{self.base_url}/webhooks/{webhook_id}")
-        response.raise_for_status()
-        return response.json()
+        result = self._call(
+            "DELETE",
+            f"/webhooks/{webhook_id}",
+            endpoint="/webhooks/{webhook_id}"
+        )
+        self._invalidate_path("/webhooks")
+        return result
     
     def test_webhook(self, webhook_id: str) -> Dict:
         """
@@ -1284,11 +1993,11 @@ class MemoryClient:
         Returns:
             Test result
         """
-        response = self.session.post(
-            f"{self.base_url}/webhooks/{webhook_id}/test"
+        return self._call(
+            "POST",
+            f"/webhooks/{webhook_id}/test",
+            endpoint="/webhooks/{webhook_id}/test"
         )
-        response.raise_for_status()
-        return response.json()
     
     # Observability
     def get_metrics(self) -> Dict:
@@ -1298,9 +2007,7 @@ class MemoryClient:
         Returns:
             Metrics dictionary
         """
-        response = self.session.get(f"{self.base_url}/metrics")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("/metrics", ttl=10)
     
     def get_metrics_summary(self) -> Dict:
         """
@@ -1309,9 +2016,7 @@ class MemoryClient:
         Returns:
             Metrics summary dictionary
         """
-        response = self.session.get(f"{self.base_url}/metrics/summary")
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get("/metrics/summary", ttl=10)
     
     def get_audit_logs(
         self,
@@ -1332,14 +2037,107 @@ class MemoryClient:
         if user_id:
             params["user_id"] = user_id
         
-        response = self.session.get(
-            f"{self.base_url}/audit-logs",
-            params=params
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = self._call("GET", "/audit-logs", params=params)
         # Backend returns {"logs": [...]}, extract the list
         if isinstance(result, dict) and "logs" in result:
             return result["logs"]
         return result if isinstance(result, list) else []
+    
+    def iter_audit_logs(
+        self,
+        user_id: Optional[str] = None,
+        page_size: int = 500
+    ) -> Iterator[Dict]:
+        """
+        Iterate over audit logs page by page.
+        
+        Only one page is held in memory at a time. Pages are requested with
+        the ``next_cursor`` returned by the server; iteration stops when no
+        cursor is returned.
+        
+        Args:
+            user_id: Optional user ID filter
+            page_size: Number of logs requested per page
+        
+        Yields:
+            Audit log entries
+        """
+        params = {"limit": page_size}
+        if user_id:
+            params["user_id"] = user_id
+        
+        while True:
+            result = self._call("GET", "/audit-logs", params=params)
+            if isinstance(result, dict):
+                yield from result.get("logs") or []
+                cursor = result.get("next_cursor")
+            else:
+                yield from result if isinstance(result, list) else []
+                cursor = None
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+
+class ThreadedMemoryClient(MemoryClient):
+    """
+    MemoryClient with ``map_*`` helpers that fan calls out over a thread pool.
+
+    A lighter alternative to ``AsyncMemoryClient`` for synchronous code: the
+    HTTP layer releases the GIL during socket I/O, so N independent calls
+    complete in roughly one round trip. The pool is sized to ``pool_maxsize``
+    so every worker gets its own pooled connection.
+
+    Usage:
+        with ThreadedMemoryClient(base_url, api_key=key) as client:
+            results = client.map_search([{"user_id": "u1", "query": "pets"}, ...])
+    """
+
+    def __init__(self, *args, max_workers: Optional[int] = None, **kwargs):
+        """
+        Initialize the client.
+
+        Args:
+            max_workers: Thread pool size; defaults to ``pool_maxsize``
+            *args, **kwargs: Passed through to ``MemoryClient``
+        """
+        super().__init__(*args, **kwargs)
+        self.max_workers = max_workers or self.pool_maxsize
+        self._executor: Optional["ThreadPoolExecutor"] = None
+
+    @property
+    def executor(self) -> "ThreadPoolExecutor":
+        """Thread pool used by the ``map_*`` helpers, created on first use."""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="memphora"
+            )
+        return self._executor
+
+    def map_search(self, queries: List[Dict]) -> List[List[Dict]]:
+        """
+        Run several searches concurrently.
+
+        Args:
+            queries: List of keyword-argument dicts for ``search_memories``
+
+        Returns:
+            List of search results, in the same order as ``queries``
+        """
+        return list(self.executor.map(lambda q: self.search_memories(**q), queries))
+
+    def map_get_memory(self, memory_ids: List[str]) -> List[Dict]:
+        """Fetch several memories concurrently, preserving order."""
+        return list(self.executor.map(self.get_memory, memory_ids))
+
+    def map_user_statistics(self, user_ids: List[str]) -> List[Dict]:
+        """Fetch statistics for several users concurrently, preserving order."""
+        return list(self.executor.map(self.get_user_statistics, user_ids))
 
+    def close(self) -> None:
+        """Shut down the thread pool and close the HTTP session."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        super().close()
@@ -2,11 +2,21 @@
 Memphora SDK - Standalone version for PyPI (no internal dependencies)
 Simple, One-Line Integration for Developers
 """
-from typing import List, Dict, Optional, Any, Callable
-from memory_client import MemoryClient
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, BinaryIO, Callable, Iterator, Union
+from memory_client import MemoryClient, MemphoraHTTPError
+from circuit_breaker import CircuitOpenError
+from semantic_cache import SemanticCache
+from buffered_writer import BufferedWriter
+from response_cache import TTLCache
 import inspect
+import json
 from functools import wraps
 import logging
+import threading
+from collections import deque
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
 
 # Use standard logging instead of internal logger
 logger = logging.getLogger(__name__)
@@ -18,6 +28,40 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 
+def _api_call(action: str, default: Optional[Callable[[], Any]] = None) -> Callable:
+    """
+    Log and swallow errors raised by a Memphora method.
+    
+    On failure the method logs "Failed to <action>: <error>" and returns
+    ``default()`` (e.g. ``dict`` for a fresh ``{}``), or None without a default.
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                logger.error("Failed to %s: %s", action, e)
+                return default() if default is not None else None
+        return wrapper
+    return decorator
+
+
+# Keyword arguments checked, in order, for the user message of a @remember call
+_MESSAGE_KWARGS = ('message', 'user_message', 'query')
+
+# User messages that carry nothing worth extracting (compared after _fingerprint)
+_TRIVIAL_MESSAGES = frozenset({
+    "hi", "hello", "hey", "thanks", "thank you", "thx", "ok", "okay", "k",
+    "yes", "no", "yep", "nope", "sure", "cool", "great", "bye", "goodbye",
+})
+
+# (api_url, api_key, transport, pool_maxsize, local_encryption, wire_format, semantic cache)
+# -> MemoryClient shared by every Memphora created with share_client=True and the same settings
+_SHARED_CLIENTS: Dict[tuple, MemoryClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
 class Memphora:
     """
     Simple, developer-friendly SDK for Memphora.
@@ -48,7 +92,20 @@ class Memphora:
         api_key: Optional[str] = None,
         api_url: Optional[str] = None,
         auto_compress: bool = True,
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        transport: str = "requests",
+        pool_maxsize: int = 32,
+        enable_semantic_cache: bool = False,
+        semantic_cache: Optional[SemanticCache] = None,
+        background_store: bool = False,
+        warmup_queries: Optional[List[str]] = None,
+        dedupe_stores: bool = False,
+        share_client: bool = False,
+        skip_trivial_turns: bool = False,
+        local_encryption: bool = False,
+        warm: bool = False,
+        wire_format: str = "json",
+        client: Optional[MemoryClient] = None
     ):
         """
         Initialize Memphora SDK.
@@ -59,17 +116,91 @@ class Memphora:
             api_url: Optional API URL (defaults to cloud API, only needed for custom endpoints)
             auto_compress: Automatically compress context (default: True)
             max_tokens: Maximum tokens for context (default: 500)
+            transport: HTTP transport for the underlying MemoryClient ("requests",
+                "httpx" for HTTP/2 multiplexing, or "urllib3")
+            pool_maxsize: Keep-alive connections kept per host; raise it when many
+                threads share one Memphora instance
+            enable_semantic_cache: Answer get_context/search for repeated or
+                paraphrased queries from a local embedding cache instead of the
+                API (pip install memphora[semantic-cache])
+            semantic_cache: Optional pre-configured SemanticCache (e.g. with a
+                lower threshold or custom embedder); implies enable_semantic_cache
+            background_store: Store conversations captured by @remember on a
+                background thread so the decorated call returns as soon as the
+                wrapped function does; flush() waits for pending stores
+            warmup_queries: Common queries (e.g. conversation openers) to fetch
+                in the background at startup so get_context answers them from
+                the semantic cache; see warmup()
+            dedupe_stores: Skip store() calls whose content and metadata match a
+                memory this instance stored in the last hour, ignoring case,
+                whitespace and trailing punctuation in the content; the earlier
+                memory is returned with "deduplicated": True
+            share_client: Reuse one MemoryClient (connection pool, TLS sessions,
+                caches) across all Memphora instances in the process with the
+                same API URL, key and client settings; useful when creating one
+                instance per user. Release it with Memphora.close_shared()
+            skip_trivial_turns: Don't send conversations for extraction when the
+                user message is a bare greeting/acknowledgement ("hi", "thanks",
+                "ok", ...) or repeats one of the last 32 stored exchanges
+            local_encryption: Run encrypt_data/decrypt_data locally with AES-256-GCM
+                using a data key fetched once from the API, instead of one request
+                per value (pip install memphora[crypto])
+            warm: Open a pooled connection to the API on a background thread so
+                the first call doesn't pay the TCP/TLS handshake
+            wire_format: "json" (default) or "msgpack" for smaller request bodies
+                on large batch_store/record_conversation payloads; needs server
+                support (pip install memphora[msgpack])
+            client: Existing MemoryClient to use instead of building one, e.g. a
+                single client (and connection pool) shared by a whole test session;
+                the client-related options above are then ignored and close()
+                leaves the client open
         """
         # Default to production API - users only need to provide API key
         if api_url is None:
             api_url = "https://api.memphora.ai/api/v1"
         self.user_id = user_id
         self.api_key = api_key
-        self.client = MemoryClient(base_url=api_url, api_key=api_key)
+        client_options = {
+            "base_url": api_url,
+            "api_key": api_key,
+            "transport": transport,
+            "pool_maxsize": pool_maxsize,
+            "enable_semantic_cache": enable_semantic_cache,
+            "semantic_cache": semantic_cache,
+            "local_encryption": local_encryption,
+            "wire_format": wire_format
+        }
+        # Injected and shared clients outlive this instance, so close() leaves them open
+        self._shared_client = share_client or client is not None
+        if client is not None:
+            self.client = client
+        elif share_client:
+            key = (api_url, api_key, transport, pool_maxsize, local_encryption, wire_format,
+                   id(semantic_cache) if semantic_cache is not None else enable_semantic_cache)
+            with _SHARED_CLIENTS_LOCK:
+                client = _SHARED_CLIENTS.get(key)
+                if client is None:
+                    client = _SHARED_CLIENTS[key] = MemoryClient(**client_options)
+            self.client = client
+        else:
+            self.client = MemoryClient(**client_options)
         self.auto_compress = auto_compress
         self.max_tokens = max_tokens
+        self._writer: Optional[BufferedWriter] = None
+        self.background_store = background_store
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._pool_maxsize = pool_maxsize
+        self._pending: set = set()
+        self._pending_lock = threading.Lock()
+        self._stored = TTLCache(maxsize=10000, ttl=3600) if dedupe_stores else None
+        self._recent_turns: Optional[deque] = deque(maxlen=32) if skip_trivial_turns else None
         
-        logger.info(f"Memphora SDK initialized for user {user_id}")
+        logger.info("Memphora SDK initialized for user %s", user_id)
+        
+        if warm:
+            threading.Thread(target=self.client._warm_up, name="memphora-warm", daemon=True).start()
+        if warmup_queries:
+            self.warmup(warmup_queries)
     
     def remember(self, func: Callable) -> Callable:
         """
@@ -81,16 +212,48 @@ class Memphora:
                 return ai_response(user_message)
         
         The decorator will:
-        1. Search for relevant memories
+        1. Search for relevant memories (only if the function accepts a
+           memory_context argument or **kwargs)
         2. Add them to your function's context
         3. Store the conversation after response
+        
+        Async functions are supported; the context lookup and the store then
+        run in a worker thread so the event loop isn't blocked.
         """
+        # Introspect once at decoration time rather than on every call
+        params = inspect.signature(func).parameters.values()
+        has_params = bool(params)
+        accepts_context = any(
+            p.name == 'memory_context' or p.kind is inspect.Parameter.VAR_KEYWORD for p in params
+        )
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                import asyncio
+                loop = asyncio.get_running_loop()
+                user_message = self._extract_message(has_params, args, kwargs)
+                
+                if user_message and accepts_context:
+                    kwargs['memory_context'] = await loop.run_in_executor(
+                        None, self.get_context, user_message
+                    )
+                
+                result = await func(*args, **kwargs)
+                
+                if user_message and result:
+                    await loop.run_in_executor(None, self._after_response, user_message, result)
+                
+                return result
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Extract user message from args or kwargs
-            user_message = self._extract_message(func, args, kwargs)
+            user_message = self._extract_message(has_params, args, kwargs)
             
-            if user_message:
+            if user_message and accepts_context:
                 # Get relevant context
                 context = self.get_context(user_message)
                 
@@ -102,40 +265,87 @@ class Memphora:
             
             # Store conversation
             if user_message and result:
-                self.store_conversation(user_message, result)
+                self._after_response(user_message, result)
             
             return result
         
         return wrapper
     
+    def _after_response(self, user_message: str, result: Any) -> None:
+        """Store a remembered exchange, on the background executor if enabled."""
+        if not self.background_store:
+            self.store_conversation(user_message, result)
+            return
+        executor = self._get_executor()
+        with self._pending_lock:
+            future = executor.submit(self.store_conversation, user_message, result)
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+    
+    def _get_executor(self) -> "ThreadPoolExecutor":
+        """Thread pool for background stores and batch_* fan-out, created on first use."""
+        with self._pending_lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                # One worker per pooled connection, so workers never wait on the pool
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(16, self._pool_maxsize), thread_name_prefix="memphora"
+                )
+            return self._executor
+    
+    def _discard_pending(self, future: "Future") -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+    
+    @_api_call("get context", str)
     def get_context(self, query: str, limit: int = 5) -> str:
         """Get relevant context for a query."""
-        try:
-            logger.debug(f"SDK get_context: user_id={self.user_id}, query={query[:50]}, base_url={self.client.base_url}")
-            memories = self.client.search_memories(
-                user_id=self.user_id,
-                query=query,
-                limit=limit
-            )
-            logger.debug(f"SDK get_context: got {len(memories) if memories else 0} memories")
-            
-            if not memories:
-                return ""
-            
-            # Format context
-            context_lines = []
-            for mem in memories:
-                content = mem.get('content', '')
-                context_lines.append(f"- {content}")
-            
-            context = "Relevant context from past conversations:\n" + "\n".join(context_lines)
-            return context
-            
-        except Exception as e:
-            logger.error(f"Failed to get context: {e}")
+        logger.debug("SDK get_context: user_id=%s, query=%.50s, base_url=%s", self.user_id, query, self.client.base_url)
+        memories = self.client.search_memories(
+            user_id=self.user_id,
+            query=query,
+            limit=limit
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SDK get_context: got %d memories", len(memories) if memories else 0)
+        
+        if not memories:
             return ""
+        
+        # Format context in a single join
+        return "Relevant context from past conversations:\n- " + "\n- ".join(
+            [mem.get('content', '') for mem in memories]
+        )
+    
+    def warmup(self, queries: List[str], limit: int = 5) -> Optional[threading.Thread]:
+        """
+        Pre-fetch context for common queries on a background thread.
+        
+        Results land in the semantic cache, so later get_context calls with the
+        same (or similar) queries skip the API. Does nothing unless the
+        semantic cache is enabled.
+        
+        Args:
+            queries: Queries to pre-fetch
+            limit: Result limit, matching the get_context calls to be served
+        
+        Returns:
+            The started warmup thread, or None when the semantic cache is disabled
+        """
+        if self.client._semantic_cache is None:
+            logger.warning("warmup() needs enable_semantic_cache=True; skipping")
+            return None
+        
+        def run():
+            for query in queries:
+                self.get_context(query, limit=limit)
+        
+        thread = threading.Thread(target=run, name="memphora-warmup", daemon=True)
+        thread.start()
+        return thread
     
-    def store(self, content: str, metadata: Optional[Dict] = None) -> Dict:
+    @_api_call("store memory", dict)
+    def store(self, content: str, metadata: Optional[Dict] = None, buffered: bool = False) -> Dict:
         """
         Store a memory. Stores complete content directly (preserves exact content).
         
@@ -144,21 +354,39 @@ class Memphora:
         Args:
             content: Memory content
             metadata: Optional metadata dictionary
+            buffered: Queue the memory and send it with others through one
+                batch_create request (after 100 memories or 10ms, or on flush())
         
         Returns:
-            Created memory dictionary
+            Created memory dictionary ({"status": "queued"} when buffered)
         """
-        try:
-            # Store complete memory directly (preserves exact content)
-            # With optimized storage, this is fast (~50ms) and maintains data quality
-            return self.client.add_memory(
-                user_id=self.user_id,
-                content=content,
-                metadata=metadata or {}
+        key = None
+        if self._stored is not None:
+            # Metadata is part of the key so a store with new metadata isn't swallowed
+            key = (
+                _fingerprint(content),
+                json.dumps(metadata, sort_keys=True, default=str) if metadata else None
             )
-        except Exception as e:
-            logger.error(f"Failed to store memory: {e}")
-            return {}
+            previous = self._stored.get(key)
+            if previous is not None:
+                return {**previous, "deduplicated": True}
+        
+        if buffered:
+            if self._writer is None:
+                self._writer = self.client.buffered(max_batch=100, max_wait_ms=10)
+            self._writer.add(self.user_id, content, metadata)
+            return {"status": "queued"}
+        
+        # Store complete memory directly (preserves exact content)
+        # With optimized storage, this is fast (~50ms) and maintains data quality
+        memory = self.client.add_memory(
+            user_id=self.user_id,
+            content=content,
+            metadata=metadata
+        )
+        if key is not None and memory:
+            self._stored.set(key, memory)
+        return memory
     
     def search(
         self,
@@ -204,42 +432,99 @@ class Memphora:
                 jina_api_key=jina_api_key
             )
         except Exception as e:
-            logger.error(f"Failed to search memories: {e}")
+            logger.error("Failed to search memories: %s", e)
             return {"facts": [], "critical_context": None, "metadata": {}}
     
+    @_api_call("store conversation")
     def store_conversation(self, user_message: str, ai_response: str) -> None:
         """Store a conversation for automatic memory extraction."""
-        try:
-            conversation = [
-                {"role": "user", "content": user_message},
-                {"role": "assistant", "content": ai_response}
-            ]
-            
-            self.client.extract_from_conversation(
-                user_id=self.user_id,
-                conversation=conversation
-            )
-        except Exception as e:
-            logger.error(f"Failed to store conversation: {e}")
+        if self._recent_turns is not None:
+            message = _fingerprint(user_message)
+            if message in _TRIVIAL_MESSAGES:
+                return
+            turn = (message, str(ai_response)[:200])
+            if turn in self._recent_turns:
+                return
+            self._recent_turns.append(turn)
+        
+        conversation = [
+            {"role": "user", "content": user_message},
+            {"role": "assistant", "content": ai_response}
+        ]
+        
+        self.client.extract_from_conversation(
+            user_id=self.user_id,
+            conversation=conversation
+        )
     
+    @_api_call("clear memories", bool)
     def clear(self) -> bool:
         """Clear all memories for this user."""
+        self.client.delete_all_user_memories(self.user_id)
+        self._forget_stored()
+        return True
+    
+    def _forget_stored(self) -> None:
+        """Drop store() dedupe fingerprints once stored memories may have changed."""
+        if self._stored is not None:
+            self._stored.clear()
+    
+    def _post_write(self, path: str, payload: Dict) -> Dict:
+        """POST a write MemoryClient has no method for, then drop the user's now-stale cached reads."""
+        result = self.client._call("POST", path, json=payload)
+        self.client._invalidate_caches(self.user_id)
+        return result
+    
+    def flush(self) -> List[Dict]:
+        """
+        Wait for background conversation stores, send memories queued with
+        store(buffered=True), and return the buffered memories created so far.
+        """
+        with self._pending_lock:
+            pending = list(self._pending)
+        if pending:
+            from concurrent.futures import wait
+            wait(pending)
+        if self._writer is None:
+            return []
         try:
-            result = self.client.delete_all_user_memories(self.user_id)
-            return True
+            self._writer.flush()
         except Exception as e:
-            logger.error(f"Failed to clear memories: {e}")
-            return False
+            logger.error("Failed to flush buffered memories: %s", e)
+        results, self._writer.results = self._writer.results, []
+        return results
+    
+    @classmethod
+    def close_shared(cls) -> None:
+        """Close and forget the clients shared by instances created with share_client=True."""
+        with _SHARED_CLIENTS_LOCK:
+            clients = list(_SHARED_CLIENTS.values())
+            _SHARED_CLIENTS.clear()
+        for client in clients:
+            client.close()
+    
+    def close(self) -> None:
+        """Flush pending writes and close the client's connections (shared clients stay open)."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if not self._shared_client:
+            self.client.close()
+    
+    def __enter__(self) -> "Memphora":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     # Basic CRUD Operations
+    @_api_call("get memory", dict)
     def get_memory(self, memory_id: str) -> Dict:
         """Get a specific memory by ID."""
-        try:
-            return self.client.get_memory(memory_id)
-        except Exception as e:
-            logger.error(f"Failed to get memory: {e}")
-            return {}
+        return self.client.get_memory(memory_id)
     
+    @_api_call("update memory", dict)
     def update_memory(
         self,
         memory_id: str,
@@ -247,29 +532,29 @@ class Memphora:
         metadata: Optional[Dict] = None
     ) -> Dict:
         """Update an existing memory."""
-        try:
-            return self.client.update_memory(memory_id=memory_id, content=content, metadata=metadata)
-        except Exception as e:
-            logger.error(f"Failed to update memory: {e}")
-            return {}
+        self._forget_stored()
+        return self.client.update_memory(memory_id=memory_id, content=content, metadata=metadata)
     
+    @_api_call("delete memory", bool)
     def delete_memory(self, memory_id: str) -> bool:
         """Delete a specific memory."""
-        try:
-            return self.client.delete_memory(memory_id)
-        except Exception as e:
-            logger.error(f"Failed to delete memory: {e}")
-            return False
+        self._forget_stored()
+        return self.client.delete_memory(memory_id)
     
+    @_api_call("list memories", list)
     def list_memories(self, limit: int = 100) -> List[Dict]:
         """List all memories for this user."""
-        try:
-            return self.client.get_user_memories(self.user_id, limit=limit)
-        except Exception as e:
-            logger.error(f"Failed to list memories: {e}")
-            return []
+        return self.client.get_user_memories(self.user_id, limit=limit)
+    
+    @_api_call("get related memories", list)
+    def get_related_memories(self, memory_id: str, limit: int = 10) -> List[Dict]:
+        """Get memories directly linked to a memory (one hop in the memory graph)."""
+        # depth=1 keeps the server from expanding (and sending) further hops
+        context = self.client.get_memory_context(memory_id=memory_id, depth=1)
+        return context.get("related_memories", [])[:limit]
     
     # Conversation Management
+    @_api_call("store agent memory", dict)
     def store_agent_memory(
         self,
         agent_id: str,
@@ -278,22 +563,15 @@ class Memphora:
         metadata: Optional[Dict] = None
     ) -> Dict:
         """Store a memory for a specific agent."""
-        try:
-            response = self.client.session.post(
-                f"{self.client.base_url}/agents/memories",
-                json={
-                    "user_id": self.user_id,
-                    "agent_id": agent_id,
-                    "content": content,
-                    "run_id": run_id,
-                    "metadata": metadata or {}
-                }
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to store agent memory: {e}")
-            return {}
+        payload = {
+            "user_id": self.user_id,
+            "agent_id": agent_id,
+            "content": content,
+            "run_id": run_id
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        return self._post_write("/agents/memories", payload)
     
     def search_agent_memories(
         self,
@@ -311,8 +589,9 @@ class Memphora:
                 - agent_id: The agent ID searched
         """
         try:
-            response = self.client.session.post(
-                f"{self.client.base_url}/agents/memories/search",
+            memories = self.client._call(
+                "POST",
+                "/agents/memories/search",
                 json={
                     "user_id": self.user_id,
                     "agent_id": agent_id,
@@ -321,8 +600,6 @@ class Memphora:
                     "limit": limit
                 }
             )
-            response.raise_for_status()
-            memories = response.json()
             
             # Convert to structured format matching main search()
             facts = []
@@ -340,23 +617,20 @@ class Memphora:
                 "metadata": {"run_id": run_id} if run_id else {}
             }
         except Exception as e:
-            logger.error(f"Failed to search agent memories: {e}")
+            logger.error("Failed to search agent memories: %s", e)
             return {"facts": [], "agent_id": agent_id, "metadata": {}}
     
+    @_api_call("get agent memories", list)
     def get_agent_memories(self, agent_id: str, limit: int = 100) -> List[Dict]:
         """Get all memories for a specific agent."""
-        try:
-            response = self.client.session.get(
-                f"{self.client.base_url}/agents/{agent_id}/memories",
-                params={"user_id": self.user_id, "limit": limit}
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to get agent memories: {e}")
-            return []
+        return self.client._call(
+            "GET",
+            f"/agents/{agent_id}/memories",
+            params={"user_id": self.user_id, "limit": limit}
+        )
     
     # Group/Collaborative Features
+    @_api_call("store group memory", dict)
     def store_group_memory(
         self,
         group_id: str,
@@ -364,21 +638,14 @@ class Memphora:
         metadata: Optional[Dict] = None
     ) -> Dict:
         """Store a shared memory for a group."""
-        try:
-            response = self.client.session.post(
-                f"{self.client.base_url}/groups/memories",
-                json={
-                    "user_id": self.user_id,
-                    "group_id": group_id,
-                    "content": content,
-                    "metadata": metadata or {}
-                }
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to store group memory: {e}")
-            return {}
+        payload = {
+            "user_id": self.user_id,
+            "group_id": group_id,
+            "content": content
+        }
+        if metadata:
+            payload["metadata"] = metadata
+        return self._post_write("/groups/memories", payload)
     
     def search_group_memories(
         self,
@@ -395,8 +662,9 @@ class Memphora:
                 - group_id: The group ID searched
         """
         try:
-            response = self.client.session.post(
-                f"{self.client.base_url}/groups/memories/search",
+            memories = self.client._call(
+                "POST",
+                "/groups/memories/search",
                 json={
                     "user_id": self.user_id,
                     "group_id": group_id,
@@ -404,8 +672,6 @@ class Memphora:
                     "limit": limit
                 }
             )
-            response.raise_for_status()
-            memories = response.json()
             
             # Convert to structured format matching main search()
             facts = []
@@ -423,40 +689,47 @@ class Memphora:
                 "metadata": {}
             }
         except Exception as e:
-            logger.error(f"Failed to search group memories: {e}")
+            logger.error("Failed to search group memories: %s", e)
             return {"facts": [], "group_id": group_id, "metadata": {}}
     
+    @_api_call("get group context", dict)
     def get_group_context(self, group_id: str, limit: int = 50) -> Dict:
         """Get context for a group."""
-        try:
-            response = self.client.session.get(
-                f"{self.client.base_url}/groups/{group_id}/context",
-                params={"user_id": self.user_id, "limit": limit}
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to get group context: {e}")
-            return {}
+        return self.client._call(
+            "GET",
+            f"/groups/{group_id}/context",
+            params={"user_id": self.user_id, "limit": limit}
+        )
     
     # User Analytics
+    @_api_call("batch store", list)
     def batch_store(
         self,
         memories: List[Dict[str, str]],
         link_related: bool = True
     ) -> List[Dict]:
         """Batch create multiple memories."""
-        try:
-            return self.client.batch_create(
-                user_id=self.user_id,
-                memories=memories,
-                link_related=link_related
-            )
-        except Exception as e:
-            logger.error(f"Failed to batch store: {e}")
-            return []
+        return self.client.batch_create(
+            user_id=self.user_id,
+            memories=memories,
+            link_related=link_related
+        )
+    
+    def store_many(
+        self,
+        contents: List[str],
+        metadata: Optional[Dict] = None,
+        link_related: bool = True
+    ) -> List[Dict]:
+        """Store several memories in one request; ``metadata`` is applied to each."""
+        if metadata:
+            memories = [{"content": content, "metadata": metadata} for content in contents]
+        else:
+            memories = [{"content": content} for content in contents]
+        return self.batch_store(memories, link_related=link_related)
     
     # Memory Operations
+    @_api_call("record conversation", dict)
     def record_conversation(
         self,
         conversation: List[Dict[str, str]],
@@ -464,49 +737,52 @@ class Memphora:
         metadata: Optional[Dict] = None
     ) -> Dict:
         """Record a full conversation."""
-        try:
-            return self.client.record_conversation(
-                user_id=self.user_id,
-                conversation=conversation,
-                platform=platform or "unknown",
-                metadata=metadata or {}
-            )
-        except Exception as e:
-            logger.error(f"Failed to record conversation: {e}")
-            return {}
+        return self.client.record_conversation(
+            user_id=self.user_id,
+            conversation=conversation,
+            platform=platform or "unknown",
+            metadata=metadata
+        )
     
+    @_api_call("get conversations", list)
     def get_conversations(
         self,
         platform: Optional[str] = None,
         limit: int = 50
     ) -> List[Dict]:
         """Get user conversations."""
-        try:
-            return self.client.get_user_conversations(
-                user_id=self.user_id,
-                platform=platform,
-                limit=limit
-            )
-        except Exception as e:
-            logger.error(f"Failed to get conversations: {e}")
-            return []
+        return self.client.get_user_conversations(
+            user_id=self.user_id,
+            platform=platform,
+            limit=limit
+        )
     
+    def iter_conversations(
+        self,
+        platform: Optional[str] = None,
+        limit: int = 50
+    ) -> Iterator[Dict]:
+        """Iterate over user conversations as they download (pip install memphora[streaming]); errors propagate."""
+        return self.client.get_user_conversations_iter(
+            user_id=self.user_id,
+            platform=platform,
+            limit=limit
+        )
+    
+    @_api_call("summarize conversation", dict)
     def summarize_conversation(
         self,
         conversation: List[Dict[str, str]],
         summary_type: str = "brief"
     ) -> Dict:
         """Summarize a conversation."""
-        try:
-            return self.client.summarize_conversation(
-                conversation=conversation,
-                summary_type=summary_type
-            )
-        except Exception as e:
-            logger.error(f"Failed to summarize conversation: {e}")
-            return {}
+        return self.client.summarize_conversation(
+            conversation=conversation,
+            summary_type=summary_type
+        )
     
     # Image Operations
+    @_api_call("store image", dict)
     def store_image(
         self,
         image_url: Optional[str] = None,
@@ -515,33 +791,26 @@ class Memphora:
         metadata: Optional[Dict] = None
     ) -> Dict:
         """Store an image memory."""
-        try:
-            return self.client.store_image(
-                user_id=self.user_id,
-                image_url=image_url,
-                image_base64=image_base64,
-                description=description,
-                metadata=metadata or {}
-            )
-        except Exception as e:
-            logger.error(f"Failed to store image: {e}")
-            return {}
+        return self.client.store_image(
+            user_id=self.user_id,
+            image_url=image_url,
+            image_base64=image_base64,
+            description=description,
+            metadata=metadata
+        )
     
+    @_api_call("search images", list)
     def search_images(
         self,
         query: str,
         limit: int = 5
     ) -> List[Dict]:
         """Search image memories."""
-        try:
-            return self.client.search_images(
-                user_id=self.user_id,
-                query=query,
-                limit=limit
-            )
-        except Exception as e:
-            logger.error(f"Failed to search images: {e}")
-            return []
+        return self.client.search_images(
+            user_id=self.user_id,
+            query=query,
+            limit=limit
+        )
     
     # Document & Visual Processing
     
@@ -582,24 +851,21 @@ class Memphora:
             if text:
                 content["text"] = text
                 
-            response = self.client.session.post(
-                f"{self.client.base_url}/documents",
-                json={
-                    "user_id": self.user_id,
-                    "content": content,
-                    "metadata": metadata or {},
-                    "async_processing": async_processing
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+            payload = {
+                "user_id": self.user_id,
+                "content": content,
+                "async_processing": async_processing
+            }
+            if metadata:
+                payload["metadata"] = metadata
+            return self._post_write("/documents", payload)
         except Exception as e:
-            logger.error(f"Failed to ingest document: {e}")
+            logger.error("Failed to ingest document: %s", e)
             return {"status": "error", "error": str(e)}
     
     def upload_document(
         self,
-        file_data: bytes,
+        file_data: Union[bytes, BinaryIO],
         filename: str,
         metadata: Optional[Dict] = None
     ) -> Dict:
@@ -610,7 +876,8 @@ class Memphora:
         Files are processed automatically based on file extension.
         
         Args:
-            file_data: Raw file bytes
+            file_data: Raw file bytes, or a binary file object (streamed from
+                disk instead of read into memory when possible)
             filename: Filename with extension (e.g., "report.pdf", "notes.txt")
             metadata: Optional metadata for the document
             
@@ -618,16 +885,13 @@ class Memphora:
             Dict with job_id for tracking (async processing)
         """
         try:
-            files = {"file": (filename, file_data)}
-            response = self.client.session.post(
-                f"{self.client.base_url}/documents/upload",
-                params={"user_id": self.user_id},
-                files=files
+            return self.client.upload_document(
+                user_id=self.user_id,
+                file_data=file_data,
+                filename=filename
             )
-            response.raise_for_status()
-            return response.json()
         except Exception as e:
-            logger.error(f"Failed to upload document: {e}")
+            logger.error("Failed to upload document: %s", e)
             return {"status": "error", "error": str(e)}
     
     def get_image_url(self, memory_id: str) -> Dict:
@@ -644,82 +908,130 @@ class Memphora:
             Dict with image_url or error message
         """
         try:
-            response = self.client.session.get(
-                f"{self.client.base_url}/memories/image/{memory_id}/url"
-            )
-            response.raise_for_status()
-            return response.json()
+            return self.client._call("GET", f"/memories/image/{memory_id}/url")
         except Exception as e:
-            logger.error(f"Failed to get image URL: {e}")
+            logger.error("Failed to get image URL: %s", e)
             return {"status": "error", "error": str(e)}
     
     # Version Control
+    @_api_call("export", dict)
     def export(
         self,
         format: str = "json"
     ) -> Dict:
         """Export all memories."""
-        try:
-            return self.client.export_memories(
-                user_id=self.user_id,
-                format=format
-            )
-        except Exception as e:
-            logger.error(f"Failed to export: {e}")
-            return {}
+        return self.client.export_memories(
+            user_id=self.user_id,
+            format=format
+        )
+    
+    @_api_call("export", int)
+    def export_to_file(self, path: str, format: str = "json") -> int:
+        """Export all memories straight to a file without buffering; returns bytes written."""
+        return self.client.export_memories_to_file(
+            user_id=self.user_id,
+            path=path,
+            format=format
+        )
     
+    @_api_call("upload image", dict)
     def upload_image(
         self,
-        image_data: bytes,
+        image_data: Union[bytes, BinaryIO],
         filename: str,
         metadata: Optional[Dict] = None
     ) -> Dict:
-        """Upload an image from bytes data."""
-        try:
-            return self.client.upload_image(
-                user_id=self.user_id,
-                image_data=image_data,
-                filename=filename,
-                metadata=metadata or {}
-            )
-        except Exception as e:
-            logger.error(f"Failed to upload image: {e}")
-            return {}
+        """Upload an image from bytes or a binary file object (streamed when possible)."""
+        return self.client.upload_image(
+            user_id=self.user_id,
+            image_data=image_data,
+            filename=filename,
+            metadata=metadata
+        )
+    
+    # Fan-out helpers
+    def _fan_out(self, action: str, method: Callable, keys: List[str]) -> Dict[str, Dict]:
+        """Call ``method`` for each key concurrently; failures are logged and become error dicts."""
+        def call(key):
+            try:
+                return method(key)
+            except Exception as e:
+                logger.error("Failed to %s %s: %s", action, key, e)
+                return {"status": "error", "error": str(e)}
+        
+        return dict(zip(keys, self._get_executor().map(call, keys)))
+    
+    def batch_test_webhooks(self, webhook_ids: List[str]) -> Dict[str, Dict]:
+        """Send a test event to several webhooks concurrently, keyed by webhook ID."""
+        return self._fan_out("test webhook", self.client.test_webhook, webhook_ids)
+    
+    def batch_delete_webhooks(self, webhook_ids: List[str]) -> Dict[str, Dict]:
+        """Delete several webhooks concurrently, keyed by webhook ID."""
+        return self._fan_out("delete webhook", self.client.delete_webhook, webhook_ids)
+    
+    def batch_delete_memories(self, memory_ids: List[str]) -> Dict[str, Dict]:
+        """Delete several memories concurrently, keyed by memory ID; IDs already gone count as deleted."""
+        def delete(memory_id: str) -> Dict:
+            try:
+                self.client.delete_memory(memory_id)
+            except MemphoraHTTPError as e:
+                if e.status_code != 404:
+                    raise
+            return {"status": "deleted"}
+        
+        self._forget_stored()
+        return self._fan_out("delete memory", delete, memory_ids)
+
+    def batch_get_compliance_reports(
+        self,
+        organization_ids: List[str],
+        compliance_type: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """Fetch compliance reports for several organizations concurrently, keyed by organization ID."""
+        def report(organization_id: str) -> Dict:
+            return self.client.get_compliance_report(organization_id, compliance_type)
+        return self._fan_out("get compliance report for", report, organization_ids)
+    
+    def cache_stats(self) -> Dict:
+        """Return semantic cache hit/miss counters (empty when the cache is disabled)."""
+        cache = self.client._semantic_cache
+        return cache.stats() if cache is not None else {}
     
     # Text Processing
+    @_api_call("check health", dict)
     def health(self) -> Dict:
         """Check API health."""
-        try:
-            return self.client.health_check()
-        except Exception as e:
-            logger.error(f"Failed to check health: {e}")
-            return {}
+        return self.client.health_check()
     
     # Webhooks
     def __getattr__(self, name):
         """Delegate unknown methods to client for backward compatibility."""
-        if hasattr(self.client, name):
-            return getattr(self.client, name)
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        try:
+            attr = getattr(self.__dict__["client"], name)
+        except (KeyError, AttributeError):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+        if callable(attr):
+            # Bind once: later lookups are plain instance-dict hits, not __getattr__ calls
+            self.__dict__[name] = attr
+        return attr
     
-    def _extract_message(self, func: Callable, args: tuple, kwargs: dict) -> Optional[str]:
+    def _extract_message(self, has_params: bool, args: tuple, kwargs: dict) -> Optional[str]:
         """Extract user message from function arguments."""
-        if 'message' in kwargs:
-            return kwargs['message']
-        if 'user_message' in kwargs:
-            return kwargs['user_message']
-        if 'query' in kwargs:
-            return kwargs['query']
-        
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
+        for key in _MESSAGE_KWARGS:
+            if key in kwargs:
+                return kwargs[key]
         
-        if args and len(params) > 0:
+        if args and has_params:
             return str(args[0])
         
         return None
 
 
+def _fingerprint(content: str) -> str:
+    """Normalize content for store() deduplication: case, whitespace and trailing punctuation."""
+    return " ".join(content.lower().split()).rstrip(".!?,;:")
+
+
 # Convenience functions
 def init(user_id: str, api_key: Optional[str] = None, **kwargs) -> Memphora:
     """Initialize Memphora SDK (convenience function)."""
@@ -733,7 +1045,7 @@ def remember(user_id: str, api_key: Optional[str] = None, api_url: Optional[str]
 
 
 # Export main classes
-__all__ = ['Memphora', 'init', 'remember']
+__all__ = ['Memphora', 'MemphoraHTTPError', 'CircuitOpenError', 'init', 'remember']
 
 # Import integrations (optional - only if frameworks are installed)
 try:
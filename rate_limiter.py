@@ -0,0 +1,119 @@
+"""Adaptive client-side concurrency limiting for Memphora API calls."""
+import threading
+import time
+from typing import Any, Optional
+
+
+class AIMDLimiter:
+    """
+    Thread-safe concurrency limit tuned by additive-increase/multiplicative-decrease.
+
+    Each request holds a slot while in flight. Fast successful responses grow
+    the limit by ``increase`` per window of requests; 429/502/503/504 responses
+    and connection failures multiply it by ``decrease``. ``Retry-After`` and
+    ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` headers pause new requests
+    until the server is ready again.
+
+    Usage:
+        limiter = AIMDLimiter(initial=16, maximum=64)
+        limiter.acquire()
+        try:
+            response = session.get(url)
+        finally:
+            limiter.release(response, latency)
+    """
+
+    BACKOFF_STATUSES = frozenset({429, 502, 503, 504})
+
+    def __init__(
+        self,
+        initial: int = 16,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        target_latency: float = 1.0,
+        low_remaining: float = 0.1
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting number of concurrent requests
+            minimum: Lower bound for the limit
+            maximum: Upper bound for the limit
+            increase: Slots added per window of healthy responses
+            decrease: Factor applied to the limit on overload signals
+            target_latency: Responses slower than this (seconds) don't grow the limit
+            low_remaining: Pause when the remaining rate-limit quota drops below
+                this fraction of the total
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self.low_remaining = low_remaining
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._pause_until = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.minimum, int(self._limit))
+
+    def acquire(self) -> None:
+        """Block until a slot is free and any server-requested pause has passed."""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            pause = self._pause_until - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+
+    def release(self, response: Optional[Any], latency: float) -> None:
+        """
+        Free a slot and adapt the limit to the outcome of the request.
+
+        Args:
+            response: Response object (requests/httpx style), or None if the
+                request failed before a response arrived
+            latency: Seconds the request took
+        """
+        with self._cond:
+            self._in_flight -= 1
+            status = response.status_code if response is not None else None
+            if status is None or status in self.BACKOFF_STATUSES:
+                self._limit = max(self.minimum, self._limit * self.decrease)
+            elif status < 400 and latency <= self.target_latency:
+                self._limit = min(self.maximum, self._limit + self.increase / self._limit)
+            if response is not None:
+                self._apply_pause(response.headers, status)
+            self._cond.notify_all()
+
+    def _apply_pause(self, headers, status: int) -> None:
+        delay = _seconds(headers.get("Retry-After"))
+        if delay is None:
+            remaining = _seconds(headers.get("X-RateLimit-Remaining"))
+            total = _seconds(headers.get("X-RateLimit-Limit"))
+            if remaining is not None and total and remaining / total < self.low_remaining:
+                delay = _seconds(headers.get("X-RateLimit-Reset"))
+                if delay is not None and delay > 1e9:
+                    # Some servers send the reset time as a Unix timestamp
+                    delay -= time.time()
+        elif status not in self.BACKOFF_STATUSES:
+            return
+        if delay:
+            self._pause_until = max(self._pause_until, time.monotonic() + delay)
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -0,0 +1,221 @@
+"""Client-side semantic cache for Memphora search results."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Sequence
+
+from response_cache import TTLCache
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_MISSING = object()
+
+
+class SemanticCache:
+    """
+    Cache search responses keyed by query meaning rather than exact text.
+
+    Queries are embedded locally and compared by cosine similarity against
+    previously cached queries in the same scope. Repeats of the exact same
+    query text are answered from a plain dict lookup before any embedding is
+    computed. A scope is any hashable tuple
+    whose first element is the user ID (e.g. ``(user_id, "search", limit)``),
+    so results are never shared across users or differing search options.
+
+    Usage:
+        cache = SemanticCache(threshold=0.95)
+        result = cache.get_or_fetch(scope, query, lambda: backend_search(query))
+
+    Requires numpy, plus fastembed unless a custom ``embedder`` is given:
+    pip install memphora[semantic-cache]
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        ttl: float = 86400,
+        max_size: int = 1000,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        model_name: str = DEFAULT_EMBEDDING_MODEL
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cached response to be reused
+            ttl: Seconds a cached response stays valid
+            max_size: Maximum number of cached responses across all scopes
+            embedder: Optional callable mapping a query string to a vector.
+                Defaults to a local fastembed model loaded on first use.
+            model_name: fastembed model used when no embedder is given
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "SemanticCache requires numpy. Install with: pip install memphora[semantic-cache]"
+            )
+        self._np = numpy
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        self.model_name = model_name
+        self._embedder = embedder
+        self._lock = threading.Lock()
+        # scope -> _Bucket, least recently used scope first
+        self._buckets: "OrderedDict[Hashable, _Bucket]" = OrderedDict()
+        self._size = 0
+        # (scope, query) -> result; exact repeats skip the embedding model entirely
+        self._exact = TTLCache(maxsize=max_size, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, query: str):
+        """Return the L2-normalized float32 embedding of ``query``."""
+        if self._embedder is None:
+            self._embedder = self._load_default_embedder()
+        vector = self._np.asarray(self._embedder(query), dtype=self._np.float32)
+        norm = self._np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _load_default_embedder(self) -> Callable[[str], Sequence[float]]:
+        try:
+            from fastembed import TextEmbedding
+        except ImportError:
+            raise ImportError(
+                "SemanticCache needs fastembed for its default embedder. "
+                "Install with: pip install memphora[semantic-cache] or pass embedder=..."
+            )
+        model = TextEmbedding(model_name=self.model_name)
+        return lambda text: next(iter(model.embed([text])))
+
+    def get_or_fetch(
+        self,
+        scope: Hashable,
+        query: str,
+        fetch: Callable[[], Any],
+        refresh: bool = False
+    ) -> Any:
+        """
+        Return a cached response for a similar query, or call ``fetch`` and cache it.
+
+        Args:
+            scope: Cache scope; first element must be the user ID
+            query: Query text
+            fetch: Zero-argument callable performing the real request
+            refresh: Skip the lookup and always call ``fetch`` (result is still cached)
+
+        Returns:
+            Cached or freshly fetched response
+        """
+        key = (scope, query)
+        if not refresh:
+            result = self._exact.get(key, _MISSING)
+            if result is not _MISSING:
+                with self._lock:
+                    self.hits += 1
+                return result
+        embedding = self.embed(query)
+        if not refresh:
+            hit, result = self._lookup(scope, embedding)
+            if hit:
+                self._exact.set(key, result)
+                return result
+        result = fetch()
+        self._store(scope, embedding, result)
+        self._exact.set(key, result)
+        return result
+
+    def _lookup(self, scope: Hashable, embedding):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(scope)
+            if bucket is None or not bucket.results:
+                self.misses += 1
+                return False, None
+            self._buckets.move_to_end(scope)
+            scores = bucket.matrix(self._np) @ embedding
+            best = int(scores.argmax())
+            if scores[best] >= self.threshold and bucket.expires[best] > now:
+                self.hits += 1
+                return True, bucket.results[best]
+            self.misses += 1
+            return False, None
+
+    def _store(self, scope: Hashable, embedding, result: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(scope)
+            if bucket is None:
+                bucket = self._buckets[scope] = _Bucket()
+            else:
+                self._buckets.move_to_end(scope)
+            self._size -= bucket.prune(now)
+            bucket.append(embedding, result, now + self.ttl)
+            self._size += 1
+            while self._size > self.max_size:
+                oldest_scope, oldest = next(iter(self._buckets.items()))
+                oldest.pop_oldest()
+                self._size -= 1
+                if not oldest.results:
+                    del self._buckets[oldest_scope]
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop cached responses for ``user_id``, or everything when omitted."""
+        with self._lock:
+            if user_id is None:
+                self._buckets.clear()
+                self._size = 0
+                self._exact.invalidate()
+                return
+            self._exact.invalidate(lambda key: key[0][0] == user_id)
+            for scope in [s for s in self._buckets if s[0] == user_id]:
+                self._size -= len(self._buckets.pop(scope).results)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current number of cached responses."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": self._size,
+        }
+
+
+class _Bucket:
+    """Cached responses for one scope, with embeddings stacked for a single matmul."""
+
+    __slots__ = ("embeddings", "results", "expires", "_matrix")
+
+    def __init__(self):
+        self.embeddings = []
+        self.results = []
+        self.expires = []
+        self._matrix = None
+
+    def matrix(self, np):
+        if self._matrix is None:
+            self._matrix = np.vstack(self.embeddings)
+        return self._matrix
+
+    def append(self, embedding, result: Any, expires_at: float) -> None:
+        self.embeddings.append(embedding)
+        self.results.append(result)
+        self.expires.append(expires_at)
+        self._matrix = None
+
+    def pop_oldest(self) -> None:
+        del self.embeddings[0], self.results[0], self.expires[0]
+        self._matrix = None
+
+    def prune(self, now: float) -> int:
+        """Remove expired entries and return how many were dropped."""
+        keep = [i for i, expires_at in enumerate(self.expires) if expires_at > now]
+        dropped = len(self.expires) - len(keep)
+        if dropped:
+            self.embeddings = [self.embeddings[i] for i in keep]
+            self.results = [self.results[i] for i in keep]
+            self.expires = [self.expires[i] for i in keep]
+            self._matrix = None
+        return dropped
@@ -1,5 +1,5 @@
 """Setup script for Memphora SDK (client-only package)."""
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read the README file
@@ -21,13 +21,24 @@ setup(
         "Source": "https://github.com/Memphora/memphora-sdk",
         "Issues": "https://github.com/Memphora/memphora-sdk/issues",
     },
-    packages=find_packages(where="."),
-    py_modules=["memphora_sdk", "memory_client"],
+    # Flat single-file modules only; no package discovery needed
+    packages=[],
+    py_modules=["memphora_sdk", "memory_client", "async_client", "semantic_cache", "response_cache", "buffered_writer", "circuit_breaker", "local_crypto", "rate_limiter", "urllib3_session", "json_codec", "integrations"],
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.31.0",
         "urllib3>=2.1.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9.0"],
+        "uvloop": ["uvloop>=0.19.0; sys_platform != 'win32'"],
+        "http2": ["httpx[http2]>=0.27.0"],
+        "fast": ["orjson>=3.9.0"],
+        "streaming": ["requests-toolbelt>=1.0.0", "ijson>=3.1"],
+        "crypto": ["cryptography>=41.0.0"],
+        "msgpack": ["msgpack>=1.0.0"],
+        "semantic-cache": ["numpy>=1.24.0", "fastembed>=0.2.0"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
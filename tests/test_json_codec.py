@@ -0,0 +1,28 @@
+"""Tests for json_codec: orjson (when installed) and the standard library fallback agree."""
+import json
+
+import pytest
+
+import json_codec
+
+ENCODERS = [pytest.param(json_codec.dumps, id="dumps"), pytest.param(json_codec._stdlib_dumps, id="stdlib")]
+
+
+@pytest.mark.parametrize("dumps", ENCODERS)
+def test_int_keyed_metadata(dumps):
+    payload = {"user_id": "u1", "content": "x", "metadata": {1: "one", "tag": "a"}}
+    assert json.loads(dumps(payload)) == {
+        "user_id": "u1",
+        "content": "x",
+        "metadata": {"1": "one", "tag": "a"},
+    }
+
+
+@pytest.mark.parametrize("dumps", ENCODERS)
+def test_int_beyond_64_bits(dumps):
+    assert json.loads(dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+
+@pytest.mark.parametrize("dumps", ENCODERS)
+def test_compact_unescaped_output(dumps):
+    assert dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode("utf-8")
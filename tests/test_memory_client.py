@@ -0,0 +1,65 @@
+"""Tests for MemoryClient cache invalidation, run against an in-memory fake session."""
+import pytest
+
+pytest.importorskip("numpy")
+
+import json_codec
+from memory_client import MemoryClient
+from semantic_cache import SemanticCache
+
+
+class FakeResponse:
+    def __init__(self, body, url):
+        self.status_code = 200
+        self.headers = {"Content-Type": "application/json"}
+        self.content = json_codec.dumps(body)
+        self.url = url
+
+
+class FakeSession:
+    """Records requests and answers every call with an empty JSON list or object."""
+
+    def __init__(self):
+        self.headers = {}
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        return FakeResponse([] if url.endswith("/search") else {"id": "m1"}, url)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    client = MemoryClient(semantic_cache=SemanticCache(embedder=lambda query: [1.0, 0.0]))
+    client.session = FakeSession()
+    return client
+
+
+def search_calls(client):
+    return [call for call in client.session.calls if call == ("POST", "/memories/search")]
+
+
+def test_repeated_search_is_served_from_semantic_cache(client):
+    client.search_memories("u1", "favorite color")
+    client.search_memories("u1", "favorite color")
+    assert len(search_calls(client)) == 1
+
+
+def test_store_image_invalidates_semantic_cache(client):
+    client.search_memories("u1", "favorite color")
+    client.store_image("u1", image_url="https://example.com/cat.png")
+    client.search_memories("u1", "favorite color")
+    assert len(search_calls(client)) == 2
+
+
+def test_upload_document_invalidates_semantic_cache(client):
+    client.search_memories("u1", "favorite color")
+    client.upload_document("u1", b"my favorite color is blue", "notes.txt")
+    client.search_memories("u1", "favorite color")
+    assert len(search_calls(client)) == 2
@@ -0,0 +1,149 @@
+"""Minimal requests-compatible session backed directly by urllib3.PoolManager."""
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from urllib3.util.retry import Retry
+
+import json_codec
+
+# Unread response bodies up to this size are drained so the connection can be reused;
+# larger or unknown-length ones close the connection instead
+_DRAIN_LIMIT = 64 * 1024
+
+
+class Urllib3Response:
+    """The subset of ``requests.Response`` that the Memphora clients rely on."""
+
+    __slots__ = ("status_code", "headers", "url", "_raw", "_content")
+
+    def __init__(self, raw: urllib3.BaseHTTPResponse, url: str, preloaded: bool):
+        self._raw = raw
+        self.status_code = raw.status
+        self.headers = raw.headers
+        self.url = url
+        self._content = raw.data if preloaded else None
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self._raw.read()
+        return self._content
+
+    def json(self) -> Any:
+        return json_codec.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(
+                f"{self.status_code} {kind} Error for url: {self.url}", response=self
+            )
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        return self._raw.stream(chunk_size, decode_content=True)
+
+    def close(self) -> None:
+        raw = self._raw
+        if not raw.isclosed():
+            # A pooled connection with unread bytes would hand them to the next request
+            remaining = raw.length_remaining
+            if remaining is not None and remaining <= _DRAIN_LIMIT:
+                raw.drain_conn()
+            else:
+                raw.close()
+        raw.release_conn()
+
+    def __enter__(self) -> "Urllib3Response":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class Urllib3Session:
+    """
+    Drop-in replacement for the parts of ``requests.Session`` used by ``MemoryClient``.
+
+    Skips requests' per-call machinery (prepared requests, hooks, cookies,
+    auth handlers) and calls ``urllib3.PoolManager.request`` directly.
+    Paths starting with "/" are resolved against ``base_url``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        num_pools: int = 16,
+        maxsize: int = 32,
+        retries: Optional[urllib3.Retry] = None
+    ):
+        self.base_url = base_url
+        # Same encodings requests advertises: gzip/deflate, plus br/zstd when installed
+        self.headers: Dict[str, str] = {
+            "Accept-Encoding": urllib3.make_headers(accept_encoding=True)["accept-encoding"]
+        }
+        self.http = urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize, retries=retries)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Any = None,
+        json: Any = None,
+        headers: Optional[Dict] = None,
+        files: Optional[Dict] = None,
+        stream: bool = False,
+        timeout: Optional[float] = None
+    ) -> Urllib3Response:
+        if url.startswith("/"):
+            url = self.base_url + url
+        if params:
+            # requests drops None-valued params; match it
+            query = urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
+            if query:
+                url = f"{url}{'&' if '?' in url else '?'}{query}"
+        request_headers = {**self.headers, **headers} if headers else dict(self.headers)
+        extra = {}
+        if json is not None:
+            data = json_codec.dumps(json)
+            request_headers["Content-Type"] = "application/json"
+        elif files:
+            fields = {
+                name: (filename, content.read() if hasattr(content, "read") else content, *rest)
+                for name, (filename, content, *rest) in files.items()
+            }
+            data, request_headers["Content-Type"] = urllib3.encode_multipart_formdata(fields)
+            # Uploads keep urllib3's idempotent-only policy, like the requests transport's upload adapter
+            retries = self.http.connection_pool_kw.get("retries")
+            if retries is not None:
+                extra["retries"] = retries.new(allowed_methods=Retry.DEFAULT_ALLOWED_METHODS)
+        raw = self.http.request(
+            method,
+            url,
+            body=data,
+            headers=request_headers,
+            preload_content=not stream,
+            timeout=timeout if timeout is not None else urllib3.Timeout.DEFAULT_TIMEOUT,
+            **extra
+        )
+        return Urllib3Response(raw, url, preloaded=not stream)
+
+    def get(self, url: str, **kwargs) -> Urllib3Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> Urllib3Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Urllib3Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Urllib3Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Urllib3Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self.http.clear()